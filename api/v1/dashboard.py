@@ -11,10 +11,12 @@ Routes:
 """
 
 import asyncio
+import time
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Request, Security
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 
 from core.job_manager import get_job_manager
@@ -37,6 +39,13 @@ def set_templates(templates: Jinja2Templates) -> None:
     _templates = templates
 
 
+# Serialized /status body, reused while the job history is unchanged so that
+# browser polling doesn't re-run the per-pipeline queries on every tick.
+# The TTL bounds staleness for runs triggered outside the job manager.
+STATUS_CACHE_TTL_SECONDS = 5.0
+_status_cache: Optional[tuple[tuple, float, bytes]] = None
+
+
 # Pipeline name → individual trigger endpoint path
 # Kept here so the dashboard JS can POST directly without hardcoding URLs.
 PIPELINE_TRIGGER_ENDPOINTS: dict[str, str] = {
@@ -67,7 +76,7 @@ async def get_dashboard(request: Request) -> HTMLResponse:
 @router.get("/status", response_model=DashboardStatusResponse)
 async def get_dashboard_status(
     _: str = Security(verify_pipeline_token),
-) -> DashboardStatusResponse:
+) -> Response:
     """
     Return pipeline health summary and recent job history.
 
@@ -76,11 +85,22 @@ async def get_dashboard_status(
     consecutive error streak.
 
     Also returns the last 10 background jobs from the in-memory job manager.
+    The serialized body is cached for STATUS_CACHE_TTL_SECONDS, keyed on the
+    state of those jobs.
     """
-    pipeline_entries = await asyncio.to_thread(_build_pipeline_health)
+    global _status_cache
 
     job_manager = get_job_manager()
     raw_jobs = await job_manager.list_jobs(limit=10)
+
+    cache_key = tuple((j.job_id, j.status, j.pipelines_completed, j.completed_at) for j in raw_jobs)
+    now = time.monotonic()
+    if _status_cache is not None:
+        cached_key, cached_at, cached_body = _status_cache
+        if cached_key == cache_key and now - cached_at < STATUS_CACHE_TTL_SECONDS:
+            return Response(content=cached_body, media_type="application/json")
+
+    pipeline_entries = await asyncio.to_thread(_build_pipeline_health)
     recent_jobs = [
         PipelineJobInfo(
             job_id=j.job_id,
@@ -97,7 +117,7 @@ async def get_dashboard_status(
         for j in raw_jobs
     ]
 
-    return DashboardStatusResponse(
+    response = DashboardStatusResponse(
         status="success",
         message=f"Dashboard status for {len(pipeline_entries)} pipelines",
         data=DashboardStatusData(
@@ -105,6 +125,10 @@ async def get_dashboard_status(
             recent_jobs=recent_jobs,
         ),
     )
+    # Already validated on construction; skip FastAPI's response_model revalidation
+    body = orjson.dumps(response.model_dump(mode="json"))
+    _status_cache = (cache_key, now, body)
+    return Response(content=body, media_type="application/json")
 
 
 def _build_pipeline_health() -> list[PipelineHealthEntry]:
@@ -15,6 +15,7 @@ from datetime import date
 from typing import Optional
 
 from fastapi import APIRouter, Security, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from core.job_manager import (
     get_job_manager,
@@ -642,7 +643,7 @@ async def trigger_all_pipelines_sync(
 async def list_jobs(
     _: str = Security(verify_pipeline_token),
     limit: int = Query(default=10, ge=1, le=50, description="Max jobs to return"),
-) -> JobListResponse:
+) -> ORJSONResponse:
     """
     List recent pipeline jobs.
 
@@ -651,7 +652,7 @@ async def list_jobs(
     job_manager = get_job_manager()
     jobs = await job_manager.list_jobs(limit=limit)
 
-    return JobListResponse(
+    response = JobListResponse(
         status=ApiStatus.SUCCESS,
         message=f"Found {len(jobs)} jobs",
         data=[
@@ -670,13 +671,14 @@ async def list_jobs(
             for j in jobs
         ],
     )
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
 
 @router.get("/jobs/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(
     job_id: str,
     _: str = Security(verify_pipeline_token),
-) -> JobStatusResponse:
+) -> ORJSONResponse:
     """
     Get the status of a pipeline job.
 
@@ -706,7 +708,7 @@ async def get_job_status(
         for name, r in job.results.items()
     }
 
-    return JobStatusResponse(
+    response = JobStatusResponse(
         status=ApiStatus.SUCCESS,
         message=f"Job is {job.status.value}",
         data=PipelineJobDetail(
@@ -724,6 +726,7 @@ async def get_job_status(
             error=job.error,
         ),
     )
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
 
 def _finalize_dedup_run(dedup_run_id: str, success: bool, error: str | None = None) -> None:
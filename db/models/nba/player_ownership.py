@@ -15,6 +15,8 @@ from peewee import (
     DecimalField,
     UUIDField,
     ForeignKeyField,
+    Value,
+    ValuesList,
 )
 
 from db.base import BaseModel
@@ -105,6 +107,86 @@ class PlayerOwnership(BaseModel):
 
         return ownership
 
+    @classmethod
+    def record_ownership_bulk(
+        cls,
+        rost_pcts: dict[str, float],
+        snapshot_date,
+        pipeline_run_id: UUID | None = None,
+    ) -> int:
+        """
+        Record ownership snapshots for many players in one statement.
+
+        Joins the incoming (normalized name, rost_pct) pairs against the
+        Player dimension in SQL and upserts the matches, so unmatched
+        names are dropped by the join instead of a per-name lookup.
+
+        Args:
+            rost_pcts: Mapping of normalized player name to ownership percentage
+            snapshot_date: Date of the snapshot
+            pipeline_run_id: Optional pipeline run UUID
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        if not rost_pcts:
+            return 0
+
+        return cls.bulk_upsert_query(rost_pcts, snapshot_date, pipeline_run_id).execute()
+
+    @classmethod
+    def bulk_upsert_query(
+        cls,
+        rost_pcts: dict[str, float],
+        snapshot_date,
+        pipeline_run_id: UUID | None = None,
+    ):
+        """
+        Build the INSERT ... SELECT upsert used by record_ownership_bulk.
+
+        Args:
+            rost_pcts: Non-empty mapping of normalized player name to ownership percentage
+            snapshot_date: Date of the snapshot
+            pipeline_run_id: Optional pipeline run UUID
+
+        Returns:
+            The unexecuted peewee insert query (returns a rowcount when executed)
+        """
+        values = ValuesList(
+            list(rost_pcts.items()),
+            columns=("name_normalized", "rost_pct"),
+            alias="v",
+        )
+        matched = (
+            Player.select(
+                Player.id,
+                Value(snapshot_date, converter=cls.snapshot_date.db_value),
+                values.c.rost_pct,
+                Value(pipeline_run_id, converter=cls.pipeline_run_id.db_value),
+                # insert_from doesn't apply Python-side defaults, so stamp it here
+                Value(datetime.utcnow(), converter=cls.created_at.db_value),
+            )
+            .join(values, on=(Player.name_normalized == values.c.name_normalized))
+        )
+
+        return (
+            cls.insert_from(
+                matched,
+                fields=[
+                    cls.player,
+                    cls.snapshot_date,
+                    cls.rost_pct,
+                    cls.pipeline_run_id,
+                    cls.created_at,
+                ],
+            )
+            .on_conflict(
+                conflict_target=[cls.player, cls.snapshot_date],
+                preserve=[cls.rost_pct, cls.pipeline_run_id],
+            )
+            .as_rowcount()
+        )
+
     @classmethod
     def get_player_trend(
         cls,
@@ -117,3 +117,20 @@ class Player(BaseModel):
         """
         name_normalized = name.lower().strip()
         return cls.get_or_none(cls.name_normalized == name_normalized)
+
+    @classmethod
+    def build_name_map(cls) -> dict[str, int]:
+        """
+        Load the normalized name -> player ID map in one query.
+
+        Build it once per pipeline run and pass it down; it isn't cached
+        across runs, since other processes insert and rename players.
+
+        Returns:
+            Dict mapping name_normalized to NBA player ID
+        """
+        return {
+            name: player_id
+            for player_id, name in cls.select(cls.id, cls.name_normalized).tuples()
+            if name
+        }
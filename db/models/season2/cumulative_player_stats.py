@@ -1,4 +1,4 @@
-from peewee import IntegerField, CharField, DateField, SmallIntegerField, DecimalField
+from peewee import IntegerField, CharField, DateField, SmallIntegerField, DecimalField, ValuesList
 from db.base import BaseModel
 
 
@@ -32,3 +32,28 @@ class CumulativePlayerStats(BaseModel):
         indexes = (
             (('id', 'date'), True),  # Composite unique index
         )
+
+    @classmethod
+    def update_ranks(cls, ranked_entries: list[tuple]) -> int:
+        """
+        Set rank 1..N on the given (id, date) rows, in order, in one UPDATE ... FROM (VALUES ...).
+
+        Returns the number of rows updated; an empty list runs no query, since
+        Postgres rejects an empty VALUES list.
+        """
+        if not ranked_entries:
+            return 0
+        return cls.rank_update_query(ranked_entries).execute()
+
+    @classmethod
+    def rank_update_query(cls, ranked_entries: list[tuple]):
+        """Build the UPDATE used by update_ranks for a non-empty list of (id, date) rows."""
+        ranks = ValuesList(
+            [(player_id, entry_date, i) for i, (player_id, entry_date) in enumerate(ranked_entries, start=1)],
+            columns=('id', 'date', 'rank'),
+            alias='ranks'
+        )
+        return cls.update(rank=ranks.c.rank).from_(ranks).where(
+            (cls.id == ranks.c.id) &
+            (cls.date == ranks.c.date)
+        )
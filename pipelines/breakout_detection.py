@@ -106,14 +106,7 @@ class BreakoutDetectionPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the breakout detection pipeline."""
-        if ctx.date_override:
-            as_of_date = ctx.date_override
-        else:
-            now_cst = ctx.started_at
-            if now_cst.hour < 6:
-                as_of_date = (now_cst - timedelta(days=1)).date()
-            else:
-                as_of_date = now_cst.date()
+        as_of_date = ctx.resolve_target_date()
 
         ctx.log.info("breakout_detection_start", as_of_date=str(as_of_date))
 
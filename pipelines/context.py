@@ -9,16 +9,17 @@ from __future__ import annotations
 import traceback
 import uuid
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Optional, Any
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from core.logging import get_logger
 from db.models.pipeline_run import PipelineRun
 from schemas.pipeline import PipelineResult
 from schemas.common import ApiStatus
 
+_CST = ZoneInfo("US/Central")
+
 
 @dataclass
 class PipelineContext:
@@ -43,7 +44,7 @@ class PipelineContext:
     pipeline_name: str
     run_id: uuid.UUID = field(default_factory=uuid.uuid4)
     started_at: datetime = field(
-        default_factory=lambda: datetime.now(pytz.timezone("US/Central"))
+        default_factory=lambda: datetime.now(_CST)
     )
     records_processed: int = 0
     date_override: Optional[date] = None
@@ -75,6 +76,19 @@ class PipelineContext:
         self._log = self._log.bind(run_id=str(self.run_id))
         self._log.info("pipeline_started")
 
+    def resolve_target_date(self) -> date:
+        """
+        Resolve the date a pipeline run should process.
+
+        Uses date_override when set (backfills); otherwise applies the CST
+        6am cutoff to started_at (before 6am = previous night's games).
+        """
+        if self.date_override:
+            return self.date_override
+        if self.started_at.hour < 6:
+            return (self.started_at - timedelta(days=1)).date()
+        return self.started_at.date()
+
     def increment_records(self, count: int = 1) -> None:
         """Increment the records processed counter."""
         self.records_processed += count
@@ -89,7 +103,7 @@ class PipelineContext:
         Returns:
             PipelineResult with success status
         """
-        completed_at = datetime.now(pytz.timezone("US/Central"))
+        completed_at = datetime.now(_CST)
         duration = (completed_at - self.started_at).total_seconds()
 
         if self._db_run:
@@ -120,7 +134,7 @@ class PipelineContext:
         Returns:
             PipelineResult with error status
         """
-        completed_at = datetime.now(pytz.timezone("US/Central"))
+        completed_at = datetime.now(_CST)
         duration = (completed_at - self.started_at).total_seconds()
         error_msg = f"{type(error).__name__}: {str(error)}"
         tb = traceback.format_exc()
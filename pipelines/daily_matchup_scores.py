@@ -7,8 +7,6 @@ Fetches current matchup scores for all saved teams and records daily snapshots.
 import json
 from typing import Optional
 
-import pytz
-
 from core.settings import settings
 from db.models.teams import Team
 from db.models.stats.daily_matchup_score import DailyMatchupScore
@@ -16,7 +14,7 @@ from pipelines.base import BasePipeline
 from pipelines.config import PipelineConfig
 from pipelines.context import PipelineContext
 from pipelines.extractors import ESPNExtractor, YahooExtractor
-from services.schedule_service import get_matchup_dates
+from services.schedule_service import get_current_matchup
 
 
 class DailyMatchupScoresPipeline(BasePipeline):
@@ -47,7 +45,6 @@ class DailyMatchupScoresPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the daily matchup scores pipeline."""
-        central_tz = pytz.timezone("US/Central")
         today = ctx.started_at.date()
 
         # Get current matchup info
@@ -212,18 +209,12 @@ class DailyMatchupScoresPipeline(BasePipeline):
 
     def _get_current_matchup_info(self, current_date) -> Optional[dict]:
         """Determine current matchup period and day index from schedule."""
-        for matchup_num in range(1, 25):  # Assume max 24 matchup periods
-            try:
-                dates = get_matchup_dates(matchup_num)
-                if dates:
-                    start_date, end_date = dates
-                    if start_date <= current_date <= end_date:
-                        return {
-                            "matchup_number": matchup_num,
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "day_index": (current_date - start_date).days,
-                        }
-            except Exception:
-                break
-        return None
+        matchup = get_current_matchup(current_date)
+        if not matchup:
+            return None
+        return {
+            "matchup_number": matchup["matchup_number"],
+            "start_date": matchup["start_date"],
+            "end_date": matchup["end_date"],
+            "day_index": matchup["current_day_index"],
+        }
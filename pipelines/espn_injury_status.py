@@ -9,8 +9,6 @@ BALLDONTLIE All-Star tier). ESPN's kona_player_info response already includes
 API call used by the PlayerOwnershipPipeline.
 """
 
-from datetime import date, timedelta
-
 from db.models.nba import Player, PlayerInjury
 from pipelines.base import BasePipeline
 from pipelines.config import PipelineConfig
@@ -63,14 +61,7 @@ class ESPNInjuryStatusPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the ESPN injury status pipeline."""
-        if ctx.date_override:
-            report_date = ctx.date_override
-        else:
-            now_cst = ctx.started_at
-            if now_cst.hour < 6:
-                report_date = (now_cst - timedelta(days=1)).date()
-            else:
-                report_date = now_cst.date()
+        report_date = ctx.resolve_target_date()
 
         ctx.log.info("fetching_espn_player_data", report_date=str(report_date))
 
@@ -82,7 +73,7 @@ class ESPNInjuryStatusPipeline(BasePipeline):
         ctx.log.info("espn_id_lookup_built", count=len(espn_id_lookup))
 
         # Also build name → player_id as fallback
-        name_lookup = self._build_name_lookup()
+        name_lookup = Player.build_name_map()
 
         matched = 0
         unmatched = 0
@@ -140,11 +131,3 @@ class ESPNInjuryStatusPipeline(BasePipeline):
         for player in Player.select(Player.id, Player.espn_id).where(Player.espn_id.is_null(False)):
             lookup[player.espn_id] = player.id
         return lookup
-
-    def _build_name_lookup(self) -> dict[str, int]:
-        """Build lookup dict mapping normalized name → player_id."""
-        lookup = {}
-        for player in Player.select(Player.id, Player.name_normalized):
-            if player.name_normalized:
-                lookup[player.name_normalized] = player.id
-        return lookup
@@ -6,8 +6,6 @@ Fetches NBA game schedule and results from NBA API.
 
 from datetime import datetime
 
-import pytz
-
 from core.settings import settings
 from db.models.nba import Game
 from pipelines.base import BasePipeline
@@ -42,8 +40,6 @@ class GameSchedulePipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the game schedule pipeline."""
-        central_tz = pytz.timezone("US/Central")
-
         # Determine season string
         now = ctx.started_at
         season = f"{now.year}-{str(now.year + 1)[-2:]}"
@@ -6,8 +6,6 @@ Fetches player injury data from nbainjuries package.
 
 from datetime import date
 
-import pytz
-
 from db.models.nba import Player, PlayerInjury
 from pipelines.base import BasePipeline
 from pipelines.config import PipelineConfig
@@ -41,7 +39,6 @@ class InjuryReportPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the injury report pipeline."""
-        central_tz = pytz.timezone("US/Central")
         today = ctx.started_at.date()
 
         ctx.log.info("fetching_injury_report", date=str(today))
@@ -59,8 +56,8 @@ class InjuryReportPipeline(BasePipeline):
 
         ctx.log.info("injuries_fetched", count=len(raw_injuries))
 
-        # Build player lookup by normalized name
-        player_lookup = self._build_player_lookup()
+        # Build player lookup by normalized name, once for this run
+        player_lookup = Player.build_name_map()
         ctx.log.info("player_lookup_built", player_count=len(player_lookup))
 
         # Process each injury
@@ -108,16 +105,6 @@ class InjuryReportPipeline(BasePipeline):
             records=ctx.records_processed,
         )
 
-    def _build_player_lookup(self) -> dict[str, int]:
-        """Build lookup dict mapping normalized name to player_id."""
-        from db.models.nba import Player
-
-        lookup = {}
-        for player in Player.select(Player.id, Player.name_normalized):
-            if player.name_normalized:
-                lookup[player.name_normalized] = player.id
-        return lookup
-
     def _fuzzy_match_player(
         self,
         player_name: str,
@@ -5,11 +5,6 @@ Fetches yesterday's game stats from NBA API and ESPN ownership data,
 then inserts into the nba schema tables.
 """
 
-from datetime import timedelta
-
-import pandas as pd
-import pytz
-
 from core.settings import settings
 from db.models.nba import Player, PlayerGameStats
 from db.models.nba.games import Game
@@ -17,7 +12,13 @@ from pipelines.base import BasePipeline
 from pipelines.config import PipelineConfig
 from pipelines.context import PipelineContext
 from pipelines.extractors import ESPNExtractor, NBAApiExtractor
-from pipelines.transformers import normalize_name, calculate_fantasy_points, minutes_to_int
+from pipelines.transformers import normalize_name, calculate_fantasy_points_batch, minutes_to_int
+
+# NBA game-log stat columns stored on each player_game_stats row
+GAME_STAT_COLUMNS = ["PTS", "REB", "AST", "STL", "BLK", "TOV", "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA"]
+
+# Keys of the stats dict handed to PlayerGameStats.upsert_game_stats
+GAME_STATS_KEYS = ("fpts", "min", *(col.lower() for col in GAME_STAT_COLUMNS))
 
 
 class PlayerGameStatsPipeline(BasePipeline):
@@ -46,18 +47,7 @@ class PlayerGameStatsPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the daily player stats pipeline."""
-        central_tz = pytz.timezone("US/Central")
-
-        # Determine the NBA game date. Use an explicit override for backfills;
-        # otherwise use CST with a 6am cutoff (before 6am = previous night's games).
-        if ctx.date_override:
-            game_date = ctx.date_override
-        else:
-            now_cst = ctx.started_at  # already in CST from PipelineContext
-            if now_cst.hour < 6:
-                game_date = (now_cst - timedelta(days=1)).date()
-            else:
-                game_date = now_cst.date()
+        game_date = ctx.resolve_target_date()
         date_str = game_date.strftime("%m/%d/%Y")
 
         # Determine season string (season starts in October)
@@ -104,42 +94,26 @@ class PlayerGameStatsPipeline(BasePipeline):
                     f"Missing: {missing_games}. Data not ready yet — will retry."
                 )
 
-        # Process each player
-        for _, row in stats.iterrows():
-            minutes_value = row["MIN"]
-            if pd.isna(minutes_value) or minutes_value == "" or minutes_value is None:
-                continue
+        # Drop DNP rows (blank, null or zero minutes) before any other work
+        minutes = stats["MIN"].where(stats["MIN"].notna() & (stats["MIN"] != ""), 0).map(minutes_to_int)
+        played = stats.loc[minutes > 0, ["PLAYER_ID", "PLAYER_NAME", "TEAM_ABBREVIATION", *GAME_STAT_COLUMNS]]
 
-            minutes_int = minutes_to_int(minutes_value)
-            if minutes_int == 0:
-                continue
+        # Cast and score the remaining rows column-wise, then read them back as plain dicts
+        played = played.astype({col: "int64" for col in ["PLAYER_ID", *GAME_STAT_COLUMNS]})
+        played = played.rename(columns=str.lower)
+        played["min"] = minutes[minutes > 0]
+        played["fpts"] = calculate_fantasy_points_batch(played).astype("int64")
 
-            player_id = int(row["PLAYER_ID"])
-            player_name = row["PLAYER_NAME"]
+        for row in played.to_dict("records"):
+            player_id = row["player_id"]
+            player_name = row["player_name"]
             normalized_name = normalize_name(player_name)
-            team_abbrev = row["TEAM_ABBREVIATION"]
+            team_abbrev = row["team_abbreviation"]
 
             # Get ESPN data if available
             espn_info = espn_data.get(normalized_name)
             espn_id = espn_info["espn_id"] if espn_info else None
 
-            # Calculate stats
-            player_stats = {
-                "pts": int(row["PTS"]),
-                "reb": int(row["REB"]),
-                "ast": int(row["AST"]),
-                "stl": int(row["STL"]),
-                "blk": int(row["BLK"]),
-                "tov": int(row["TOV"]),
-                "fgm": int(row["FGM"]),
-                "fga": int(row["FGA"]),
-                "fg3m": int(row["FG3M"]),
-                "fg3a": int(row["FG3A"]),
-                "ftm": int(row["FTM"]),
-                "fta": int(row["FTA"]),
-            }
-            fpts = calculate_fantasy_points(player_stats)
-
             # Upsert player dimension record
             Player.upsert_player(
                 player_id=player_id,
@@ -151,11 +125,7 @@ class PlayerGameStatsPipeline(BasePipeline):
             PlayerGameStats.upsert_game_stats(
                 player_id=player_id,
                 game_date=game_date,
-                stats={
-                    "fpts": fpts,
-                    "min": minutes_int,
-                    **player_stats,
-                },
+                stats={key: row[key] for key in GAME_STATS_KEYS},
                 team_id=team_abbrev,
                 pipeline_run_id=ctx.run_id,
             )
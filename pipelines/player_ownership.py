@@ -5,9 +5,7 @@ Fetches ESPN fantasy ownership percentages for all players and records
 daily snapshots, regardless of whether players had games that day.
 """
 
-from datetime import timedelta
-
-from db.models.nba import Player, PlayerOwnership
+from db.models.nba import PlayerOwnership
 from pipelines.base import BasePipeline
 from pipelines.config import PipelineConfig
 from pipelines.context import PipelineContext
@@ -35,37 +33,25 @@ class PlayerOwnershipPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the player ownership pipeline."""
-        # Determine the snapshot date. Use an explicit override for backfills;
-        # otherwise use CST with a 6am cutoff (before 6am = previous night's games).
-        if ctx.date_override:
-            snapshot_date = ctx.date_override
-        else:
-            now_cst = ctx.started_at  # already in CST from PipelineContext
-            if now_cst.hour < 6:
-                snapshot_date = (now_cst - timedelta(days=1)).date()
-            else:
-                snapshot_date = now_cst.date()
+        snapshot_date = ctx.resolve_target_date()
 
         ctx.log.info("fetching_espn_ownership", snapshot_date=str(snapshot_date))
 
         espn_data = self.espn_extractor.get_player_data()
         ctx.log.info("espn_data_fetched", player_count=len(espn_data))
 
-        for normalized_name, info in espn_data.items():
-            rost_pct = info.get("rost_pct")
-            if rost_pct is None:
-                continue
-
-            player = Player.find_by_name(normalized_name)
-            if player is None:
-                continue
-
-            PlayerOwnership.record_ownership(
-                player_id=player.id,
-                snapshot_date=snapshot_date,
-                rost_pct=rost_pct,
-                pipeline_run_id=ctx.run_id,
-            )
-            ctx.increment_records()
+        rost_pcts = {
+            normalized_name: info["rost_pct"]
+            for normalized_name, info in espn_data.items()
+            if info.get("rost_pct") is not None
+        }
+
+        # Single INSERT ... SELECT joined against the Player dimension
+        recorded = PlayerOwnership.record_ownership_bulk(
+            rost_pcts,
+            snapshot_date=snapshot_date,
+            pipeline_run_id=ctx.run_id,
+        )
+        ctx.increment_records(recorded)
 
         ctx.log.info("ownership_snapshot_complete", records=ctx.records_processed)
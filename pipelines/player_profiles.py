@@ -165,10 +165,13 @@ class PlayerProfilesPipeline(BasePipeline):
         ctx.increment_records(len(profiles_data))
         ctx.log.info("processing_complete", records=ctx.records_processed)
 
-    def _parse_int(self, value) -> int | None:
+    @staticmethod
+    def _parse_int(value) -> int | None:
         """Safely parse an integer value."""
-        if value is None:
+        if value is None or value == "":
             return None
+        if isinstance(value, int):
+            return value
         try:
             return int(value)
         except (ValueError, TypeError):
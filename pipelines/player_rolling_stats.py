@@ -13,7 +13,6 @@ Depends on: player_game_stats (must run first to have fresh game data)
 
 from datetime import timedelta
 
-import pytz
 from peewee import fn
 
 from db.models.nba.player_game_stats import PlayerGameStats
@@ -45,15 +44,7 @@ class PlayerRollingStatsPipeline(BasePipeline):
     def execute(self, ctx: PipelineContext) -> None:
         """Execute rolling stats materialization for all windows."""
 
-        # Determine target date using the same CST 6am cutoff used elsewhere
-        if ctx.date_override:
-            target_date = ctx.date_override
-        else:
-            now_cst = ctx.started_at  # already in CST from PipelineContext
-            if now_cst.hour < 6:
-                target_date = (now_cst - timedelta(days=1)).date()
-            else:
-                target_date = now_cst.date()
+        target_date = ctx.resolve_target_date()
 
         ctx.log.info("computing_rolling_stats", date=str(target_date), windows=WINDOWS)
 
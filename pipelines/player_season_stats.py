@@ -4,9 +4,6 @@ Cumulative Player Stats Pipeline
 Updates cumulative season stats and rankings for players who played.
 """
 
-from datetime import timedelta
-
-import pytz
 from peewee import fn
 
 from core.settings import settings
@@ -45,18 +42,7 @@ class PlayerSeasonStatsPipeline(BasePipeline):
 
     def execute(self, ctx: PipelineContext) -> None:
         """Execute the cumulative player stats pipeline."""
-        central_tz = pytz.timezone("US/Central")
-
-        # Determine the game date. Use an explicit override for backfills;
-        # otherwise use CST with a 6am cutoff (before 6am = previous night's games).
-        if ctx.date_override:
-            game_date = ctx.date_override
-        else:
-            now_cst = ctx.started_at  # already in CST from PipelineContext
-            if now_cst.hour < 6:
-                game_date = (now_cst - timedelta(days=1)).date()
-            else:
-                game_date = now_cst.date()
+        game_date = ctx.resolve_target_date()
 
         # Determine season string
         season = f"{game_date.year}-{str(game_date.year + 1)[-2:]}"
@@ -123,49 +109,25 @@ class PlayerSeasonStatsPipeline(BasePipeline):
             fpts = calculate_fantasy_points(player_stats)
 
             # Keep only the entry with highest GP for each player
-            if player_id not in entries or current_gp > entries[player_id]["gp"]:
+            if player_id not in entries or current_gp > entries[player_id][1]["gp"]:
                 # Ensure player exists in dimension table
                 Player.upsert_player(player_id=player_id, name=player_name)
 
-                entries[player_id] = {
-                    "player_id": player_id,
-                    "team_id": team_abbrev,
-                    "as_of_date": game_date,
-                    "season": season,
-                    "gp": current_gp,
-                    "fpts": fpts,
-                    "min": player["MIN"],
-                    "rost_pct": rost_pct,
-                    "pipeline_run_id": ctx.run_id,
-                    **player_stats,
-                }
+                player_stats["gp"] = current_gp
+                player_stats["fpts"] = fpts
+                player_stats["min"] = player["MIN"]
+                player_stats["rost_pct"] = rost_pct
+                entries[player_id] = (team_abbrev, player_stats)
 
         if entries:
             # Insert new records
-            for entry_data in entries.values():
+            for player_id, (team_id, stats) in entries.items():
                 PlayerSeasonStats.upsert_season_stats(
-                    player_id=entry_data["player_id"],
-                    as_of_date=entry_data["as_of_date"],
-                    season=entry_data["season"],
-                    stats={
-                        "gp": entry_data["gp"],
-                        "fpts": entry_data["fpts"],
-                        "pts": entry_data["pts"],
-                        "reb": entry_data["reb"],
-                        "ast": entry_data["ast"],
-                        "stl": entry_data["stl"],
-                        "blk": entry_data["blk"],
-                        "tov": entry_data["tov"],
-                        "min": entry_data["min"],
-                        "fgm": entry_data["fgm"],
-                        "fga": entry_data["fga"],
-                        "fg3m": entry_data["fg3m"],
-                        "fg3a": entry_data["fg3a"],
-                        "ftm": entry_data["ftm"],
-                        "fta": entry_data["fta"],
-                        "rost_pct": entry_data["rost_pct"],
-                    },
-                    team_id=entry_data["team_id"],
+                    player_id=player_id,
+                    as_of_date=game_date,
+                    season=season,
+                    stats=stats,
+                    team_id=team_id,
                     pipeline_run_id=ctx.run_id,
                 )
                 ctx.increment_records()
@@ -179,19 +141,26 @@ class PlayerSeasonStatsPipeline(BasePipeline):
         self, as_of_date, season: str, ctx: PipelineContext
     ) -> None:
         """Update rankings for all players with records on this date."""
-        # Get all records for this date ordered by fpts descending
-        records = list(
-            PlayerSeasonStats.select()
+        # Rank in SQL and apply with UPDATE ... FROM so rows never leave the DB
+        ranked = (
+            PlayerSeasonStats.select(
+                PlayerSeasonStats.id,
+                fn.ROW_NUMBER()
+                .over(order_by=[PlayerSeasonStats.fpts.desc()])
+                .alias("new_rank"),
+            )
             .where(
                 (PlayerSeasonStats.as_of_date == as_of_date)
                 & (PlayerSeasonStats.season == season)
             )
-            .order_by(PlayerSeasonStats.fpts.desc())
+            .alias("ranked")
         )
 
-        for rank, record in enumerate(records, start=1):
-            PlayerSeasonStats.update(rank=rank).where(
-                PlayerSeasonStats.id == record.id
-            ).execute()
+        updated = (
+            PlayerSeasonStats.update(rank=ranked.c.new_rank)
+            .from_(ranked)
+            .where(PlayerSeasonStats.id == ranked.c.id)
+            .execute()
+        )
 
-        ctx.log.info("rankings_updated", player_count=len(records))
+        ctx.log.info("rankings_updated", player_count=updated)
@@ -7,11 +7,13 @@ Pure functions for transforming extracted data.
 from pipelines.transformers.names import normalize_name
 from pipelines.transformers.fantasy_points import (
     calculate_fantasy_points,
+    calculate_fantasy_points_batch,
     minutes_to_int,
 )
 
 __all__ = [
     "normalize_name",
     "calculate_fantasy_points",
+    "calculate_fantasy_points_batch",
     "minutes_to_int",
 ]
@@ -6,6 +6,9 @@ Calculates fantasy points using the league scoring formula.
 
 from typing import TypedDict, Union
 
+import numpy as np
+import pandas as pd
+
 
 class PlayerStats(TypedDict):
     """Type definition for player stats used in fantasy point calculation."""
@@ -65,6 +68,46 @@ def calculate_fantasy_points(stats: PlayerStats) -> int:
     )
 
 
+# Per-stat weights of the scoring formula, as one vector for batch scoring
+_FPTS_WEIGHTS: dict[str, int] = {
+    "pts": 1,
+    "reb": 1,
+    "ast": 2,
+    "stl": 4,
+    "blk": 4,
+    "tov": -2,
+    "fg3m": 1,
+    "fgm": 2,
+    "fga": -1,
+    "ftm": 1,
+    "fta": -1,
+}
+_FPTS_COLUMNS = list(_FPTS_WEIGHTS)
+_FPTS_WEIGHT_VECTOR = np.array(list(_FPTS_WEIGHTS.values()))
+
+
+def calculate_fantasy_points_batch(stats: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized calculate_fantasy_points over a DataFrame of player stats.
+
+    Applies the same scoring formula as calculate_fantasy_points as a
+    single matrix-vector product over the stat columns instead of a
+    per-row Python call.
+
+    Args:
+        stats: DataFrame with lowercase stat columns (pts, reb, ast, stl,
+               blk, tov, fgm, fga, fg3m, ftm, fta)
+
+    Returns:
+        Series of fantasy points aligned with stats.index. The dtype follows
+        the input columns, so cast once NaN rows have been dropped.
+    """
+    return pd.Series(
+        stats[_FPTS_COLUMNS].to_numpy() @ _FPTS_WEIGHT_VECTOR,
+        index=stats.index,
+    )
+
+
 def minutes_to_int(min_str: Union[str, int, float, None]) -> int:
     """
     Convert minutes to an integer from various formats.
@@ -92,8 +135,6 @@ def minutes_to_int(min_str: Union[str, int, float, None]) -> int:
         >>> minutes_to_int(None)
         0
     """
-    import re
-
     if min_str is None:
         return 0
 
@@ -104,9 +145,9 @@ def minutes_to_int(min_str: Union[str, int, float, None]) -> int:
 
     # ISO 8601 duration format: "PT18M00.00S" (from nba_api live BoxScore)
     if s.startswith("PT"):
-        match = re.match(r"PT(\d+)M", s)
-        if match:
-            return int(match.group(1))
+        minutes, sep, _ = s[2:].partition("M")
+        if sep and minutes.isdecimal():
+            return int(minutes)
         return 0
 
     # MM:SS format: "34:56" (from nba_api stats endpoints)
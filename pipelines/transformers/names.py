@@ -4,9 +4,12 @@ Name Transformers
 Utilities for normalizing player names for matching across data sources.
 """
 
-import unicodedata
+from functools import lru_cache
 
+from utils.text import strip_combining_marks
 
+
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """
     Normalize a name by removing diacritics and converting to lowercase.
@@ -23,9 +26,5 @@ def normalize_name(name: str) -> str:
         'luka doncic'
     """
     # Decompose unicode characters (e.g., é → e + combining accent)
-    normalized = unicodedata.normalize("NFD", name)
-
-    # Remove combining diacritical marks
-    ascii_name = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
-
-    return ascii_name.lower().strip()
+    # and remove the combining marks
+    return strip_combining_marks(name).lower().strip()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from enum import Enum
 
@@ -16,8 +16,7 @@ class PipelineResult(BaseModel):
     records_processed: Optional[int] = None
     error: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 class PipelineResponse(BaseModel):
@@ -27,8 +26,7 @@ class PipelineResponse(BaseModel):
     message: str
     data: Optional[PipelineResult] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 class AllPipelinesResponse(BaseModel):
@@ -38,8 +36,7 @@ class AllPipelinesResponse(BaseModel):
     message: str
     data: Optional[dict[str, PipelineResult]] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 # ---------------------- Job-based Pipeline Responses ---------------------- #
@@ -68,8 +65,7 @@ class PipelineJobInfo(BaseModel):
     pipelines_failed: int = 0
     current_pipeline: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 class PipelineJobResult(BaseModel):
@@ -99,8 +95,7 @@ class JobCreatedResponse(BaseModel):
     message: str
     data: PipelineJobInfo
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 class JobStatusResponse(BaseModel):
@@ -110,8 +105,7 @@ class JobStatusResponse(BaseModel):
     message: str
     data: PipelineJobDetail
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 class JobListResponse(BaseModel):
@@ -121,8 +115,7 @@ class JobListResponse(BaseModel):
     message: str
     data: list[PipelineJobInfo]
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
 
 class LiveStatsData(BaseModel):
@@ -147,5 +140,4 @@ class LiveStatsResponse(BaseModel):
     message: str
     data: LiveStatsData
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
@@ -9,12 +9,15 @@ This script:
 """
 import unicodedata
 import json
+import orjson
 import requests
+from functools import lru_cache
 from db.base import db, init_db, close_db
 from db.models.season2.daily_player_stats import DailyPlayerStats
-from peewee import fn
+from peewee import fn, Case
 
 
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """
     Normalize a name by removing diacritics and converting to lowercase.
@@ -24,6 +27,10 @@ def normalize_name(name: str) -> str:
         "Luka Dončić" -> "luka doncic"
         "José Alvarado" -> "jose alvarado"
     """
+    # Plain ASCII names have nothing to decompose
+    if name.isascii():
+        return name.lower().strip()
+
     # Normalize to NFD (decomposed form), then filter out combining marks
     normalized = unicodedata.normalize('NFD', name)
     ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
@@ -54,7 +61,7 @@ def get_espn_player_data(year: int, league_id: int) -> dict:
 
     response = requests.get(endpoint, params=params, headers=headers)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     players = data.get('players', [])
     players = [x.get('player', x) for x in players]
@@ -84,9 +91,10 @@ def get_unique_players() -> list[dict]:
         DailyPlayerStats
         .select(DailyPlayerStats.name, DailyPlayerStats.team)
         .distinct()
+        .dicts()
     )
 
-    return [{'name': row.name, 'team': row.team} for row in query]
+    return list(query)
 
 
 def backfill_espn_ids(year: int = 2026, league_id: int = 993431466, dry_run: bool = False):
@@ -114,32 +122,36 @@ def backfill_espn_ids(year: int = 2026, league_id: int = 993431466, dry_run: boo
         matched = 0
         unmatched = []
         updated = 0
+        espn_ids_by_name = {}
 
-        for player in db_players:
-            name = player['name']
-            normalized = normalize_name(name)
+        # Players who changed teams appear once per team; normalize each name once
+        norm_map = {p['name']: normalize_name(p['name']) for p in db_players}
 
+        for name, normalized in norm_map.items():
             espn_info = espn_data.get(normalized)
 
             if espn_info:
                 matched += 1
                 espn_id = espn_info['espn_id']
+                espn_ids_by_name[name] = espn_id
 
                 if dry_run:
                     print(f"  [DRY RUN] Would update '{name}' -> espn_id={espn_id}")
                 else:
-                    # Update all records for this player
-                    rows_updated = (
-                        DailyPlayerStats
-                        .update(espn_id=espn_id)
-                        .where(DailyPlayerStats.name == name)
-                        .execute()
-                    )
-                    updated += rows_updated
-                    print(f"  Updated '{name}' -> espn_id={espn_id} ({rows_updated} rows)")
+                    print(f"  Matched '{name}' -> espn_id={espn_id}")
             else:
                 unmatched.append(name)
 
+        if espn_ids_by_name and not dry_run:
+            # Update all records for every matched player in one statement
+            with db.atomic():
+                updated = (
+                    DailyPlayerStats
+                    .update(espn_id=Case(DailyPlayerStats.name, list(espn_ids_by_name.items())))
+                    .where(DailyPlayerStats.name.in_(list(espn_ids_by_name)))
+                    .execute()
+                )
+
         print("\n" + "=" * 60)
         print("SUMMARY")
         print("=" * 60)
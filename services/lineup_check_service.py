@@ -16,7 +16,7 @@ class LineupIssueType(str, Enum):
     INJURED_ACTIVE = "injured_active"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LineupIssue:
     issue_type: LineupIssueType
     player_name: str
@@ -26,9 +26,17 @@ class LineupIssue:
     injury_status: Optional[str] = None
 
 
-ACTIVE_SLOTS = {"PG", "SG", "SF", "PF", "C", "G", "F", "SG/SF", "G/F", "PF/C", "F/C", "UT"}
-BENCH_SLOTS = {"BE"}
-IR_SLOTS = {"IR"}
+ACTIVE_SLOTS = frozenset({"PG", "SG", "SF", "PF", "C", "G", "F", "SG/SF", "G/F", "PF/C", "F/C", "UT"})
+BENCH_SLOTS = frozenset({"BE"})
+IR_SLOTS = frozenset({"IR"})
+
+# Slot -> category, so each player needs a single dict lookup to classify
+_SLOT_ACTIVE, _SLOT_BENCH, _SLOT_IR, _SLOT_OTHER = range(4)
+_SLOT_CATEGORY: dict[str, int] = {
+    **{slot: _SLOT_ACTIVE for slot in ACTIVE_SLOTS},
+    **{slot: _SLOT_BENCH for slot in BENCH_SLOTS},
+    **{slot: _SLOT_IR for slot in IR_SLOTS},
+}
 
 
 class LineupCheckService:
@@ -58,14 +66,32 @@ class LineupCheckService:
         alert_injured = getattr(prefs, "alert_injured_active", True) if prefs else True
 
         for player in roster:
+            slot = player.get("lineup_slot", "")
+
+            # Classify the slot once; IR and unknown slots never produce issues
+            category = _SLOT_CATEGORY.get(slot, _SLOT_OTHER)
+            if category == _SLOT_BENCH:
+                if not alert_benched:
+                    continue
+                is_bench = True
+            elif category == _SLOT_ACTIVE:
+                if not (alert_active_non_playing or alert_injured):
+                    continue
+                is_bench = False
+            else:
+                continue
+
             name = player.get("name", "Unknown")
             team = player.get("team", "")
-            slot = player.get("lineup_slot", "")
             injured = player.get("injured", False)
-            injury_status = player.get("injury_status")
 
-            # BENCHED_STARTER: player on bench, team plays today, NOT injured
-            if alert_benched and slot in BENCH_SLOTS:
+            # Free agents never have a game today, so an injured active slot
+            # is the only issue they can raise
+            if team == "FA" and (is_bench or not (injured and alert_injured)):
+                continue
+
+            if is_bench:
+                # BENCHED_STARTER: player on bench, team plays today, NOT injured
                 if team in teams_playing_today and not injured:
                     issues.append(LineupIssue(
                         issue_type=LineupIssueType.BENCHED_STARTER,
@@ -75,21 +101,10 @@ class LineupCheckService:
                         suggested_action=f"Move {name} ({team}) from bench to an active slot",
                     ))
 
-            # ACTIVE_NOT_PLAYING: player in active slot, team does NOT play today, NOT injured
-            # Exclude free agents (team == "FA")
-            if alert_active_non_playing and slot in ACTIVE_SLOTS:
-                if team != "FA" and team not in teams_playing_today and not injured:
-                    issues.append(LineupIssue(
-                        issue_type=LineupIssueType.ACTIVE_NOT_PLAYING,
-                        player_name=name,
-                        player_team=team,
-                        current_slot=slot,
-                        suggested_action=f"Consider benching {name} ({team}) - no game today",
-                    ))
-
-            # INJURED_ACTIVE: player in active slot AND injured
-            if alert_injured and slot in ACTIVE_SLOTS:
-                if injured:
+            elif injured:
+                # INJURED_ACTIVE: player in active slot AND injured
+                if alert_injured:
+                    injury_status = player.get("injury_status")
                     issues.append(LineupIssue(
                         issue_type=LineupIssueType.INJURED_ACTIVE,
                         player_name=name,
@@ -99,4 +114,15 @@ class LineupCheckService:
                         injury_status=injury_status,
                     ))
 
+            # ACTIVE_NOT_PLAYING: player in active slot, team does NOT play today, NOT injured
+            # (free agents were filtered out above)
+            elif alert_active_non_playing and team not in teams_playing_today:
+                issues.append(LineupIssue(
+                    issue_type=LineupIssueType.ACTIVE_NOT_PLAYING,
+                    player_name=name,
+                    player_team=team,
+                    current_slot=slot,
+                    suggested_action=f"Consider benching {name} ({team}) - no game today",
+                ))
+
         return issues
@@ -5,14 +5,21 @@ Handles sending lineup alert notifications to users.
 Currently uses a stub email sender; will integrate with Resend when configured.
 """
 
-import json
 from dataclasses import dataclass
 from typing import Optional
 
+from pydantic import BaseModel, ValidationError
+
 from core.logging import get_logger
 from core.settings import settings
 
 
+class _AlertLeagueInfo(BaseModel):
+    """The one league_info field an alert needs; other fields aren't validated."""
+
+    team_name: str = "Your Team"
+
+
 @dataclass
 class NotificationResult:
     success: bool
@@ -73,11 +80,11 @@ class NotificationService:
         Returns:
             Formatted email body string
         """
-        # Parse team name from league_info JSON
+        # Parse league_info JSON for just team_name, so an unrelated bad field
+        # doesn't replace a perfectly good team name
         try:
-            league_info = json.loads(team.league_info)
-            team_name = league_info.get("team_name", "Your Team")
-        except (json.JSONDecodeError, AttributeError):
+            team_name = _AlertLeagueInfo.model_validate_json(team.league_info).team_name
+        except (ValidationError, AttributeError):
             team_name = "Your Team"
 
         # Format game time
@@ -86,21 +93,20 @@ class NotificationService:
         else:
             game_time_str = "TBD"
 
-        lines = [
-            f"Team: {team_name}",
-            f"First game today: {game_time_str}",
-            "",
-            f"Found {len(issues)} lineup issue(s):",
-            "",
-        ]
-
-        for i, issue in enumerate(issues, 1):
-            lines.append(f"  {i}. {issue.suggested_action}")
-
-        lines.append("")
-        lines.append("-- Court Vision")
+        issue_lines = "".join(
+            f"  {i}. {issue.suggested_action}\n" for i, issue in enumerate(issues, 1)
+        )
 
-        return "\n".join(lines)
+        return (
+            f"Team: {team_name}\n"
+            f"First game today: {game_time_str}\n"
+            "\n"
+            f"Found {len(issues)} lineup issue(s):\n"
+            "\n"
+            f"{issue_lines}"
+            "\n"
+            "-- Court Vision"
+        )
 
     def _send_email(self, to: str, subject: str, body: str) -> NotificationResult:
         """
@@ -1,22 +1,35 @@
-import json
 import os
-from datetime import datetime, date
-import pytz
+from bisect import bisect_left
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
+import orjson
+
+
+_CST = ZoneInfo("US/Central")
 
 # Load schedule data at module level
 _SCHEDULE_DATA: dict = {}
 _SCHEDULE_DATA_V2: dict = {}
 
+# Matchup number -> (start_date, end_date, raw matchup data), in schedule order.
+# Dates are parsed once here so lookups never re-parse the JSON strings.
+_MATCHUPS: dict[int, tuple[date, date, dict]] = {}
+# Every date covered by the schedule -> its matchup number
+_DATE_INDEX: dict[date, int] = {}
+# Matchup number -> team abbreviation -> sorted game day indices
+_GAME_DAYS: dict[int, dict[str, list[int]]] = {}
+
 def _load_schedule() -> dict:
     """Load the schedule JSON file."""
     global _SCHEDULE_DATA
     if not _SCHEDULE_DATA:
         schedule_path = Path(__file__).parent.parent / "static" / "schedule25-26.json"
-        with open(schedule_path, "r") as f:
-            _SCHEDULE_DATA = json.load(f)
+        with open(schedule_path, "rb") as f:
+            _SCHEDULE_DATA = orjson.loads(f.read())
     return _SCHEDULE_DATA
 
 
@@ -25,13 +38,66 @@ def _load_schedule_v2() -> dict:
     global _SCHEDULE_DATA_V2
     if not _SCHEDULE_DATA_V2:
         schedule_path = Path(__file__).parent.parent / "static" / "matchupsPerDay25-26.json"
-        with open(schedule_path, "r") as f:
-            _SCHEDULE_DATA_V2 = json.load(f)
+        with open(schedule_path, "rb") as f:
+            _SCHEDULE_DATA_V2 = orjson.loads(f.read())
     return _SCHEDULE_DATA_V2
 
 def _parse_date(date_str: str) -> date:
     """Parse date string in MM/DD/YYYY format."""
-    return datetime.strptime(date_str, "%m/%d/%Y").date()
+    month, day, year = date_str.split("/")
+    return date(int(year), int(month), int(day))
+
+
+def _get_matchups() -> dict[int, tuple[date, date, dict]]:
+    """Get the schedule's matchups with their start/end dates pre-parsed."""
+    global _MATCHUPS, _DATE_INDEX, _GAME_DAYS
+    if not _MATCHUPS:
+        # Build into locals and publish at the end, so a concurrent caller
+        # never sees a partly built index
+        matchups: dict[int, tuple[date, date, dict]] = {}
+        date_index: dict[date, int] = {}
+        game_days: dict[int, dict[str, list[int]]] = {}
+
+        schedule = _load_schedule().get("schedule", {})
+        for matchup_num, matchup_data in schedule.items():
+            start_date = _parse_date(matchup_data["startDate"])
+            end_date = _parse_date(matchup_data["endDate"])
+            matchups[int(matchup_num)] = (start_date, end_date, matchup_data)
+            game_days[int(matchup_num)] = {
+                team: sorted(int(day) for day in team_games)
+                for team, team_games in matchup_data["games"].items()
+            }
+
+            for offset in range((end_date - start_date).days + 1):
+                date_index.setdefault(start_date + timedelta(days=offset), int(matchup_num))
+
+        # _MATCHUPS is the "built" flag, so it goes last
+        _DATE_INDEX = date_index
+        _GAME_DAYS = game_days
+        _MATCHUPS = matchups
+    return _MATCHUPS
+
+
+def _get_date_index() -> dict[date, int]:
+    """Get the date -> matchup number index for the schedule."""
+    _get_matchups()
+    return _DATE_INDEX
+
+
+def _get_matchup_game_days(matchup_number: int) -> dict[str, list[int]]:
+    """Get every team's cached sorted day indices in a matchup (do not mutate)."""
+    _get_matchups()
+    return _GAME_DAYS.get(matchup_number, {})
+
+
+def _get_game_days(matchup_number: int, team_abbrev: str) -> list[int]:
+    """Get the cached sorted day indices a team plays in a matchup (do not mutate)."""
+    return _get_matchup_game_days(matchup_number).get(team_abbrev, [])
+
+
+def _has_b2b(game_days: list[int], start: int = 0) -> bool:
+    """Whether sorted game days, from position start on, include two consecutive days."""
+    return any(game_days[i + 1] - game_days[i] == 1 for i in range(start, len(game_days) - 1))
 
 
 def get_current_matchup(current_date: Optional[date] = None) -> Optional[dict]:
@@ -48,24 +114,19 @@ def get_current_matchup(current_date: Optional[date] = None) -> Optional[dict]:
     if current_date is None:
         current_date = date.today()
 
-    schedule = _load_schedule().get("schedule", {})
-
-    for matchup_num, matchup_data in schedule.items():
-        start_date = _parse_date(matchup_data["startDate"])
-        end_date = _parse_date(matchup_data["endDate"])
-
-        if start_date <= current_date <= end_date:
-            day_index = (current_date - start_date).days
-            return {
-                "matchup_number": int(matchup_num),
-                "start_date": start_date,
-                "end_date": end_date,
-                "game_span": matchup_data["gameSpan"],
-                "games": matchup_data["games"],
-                "current_day_index": day_index
-            }
+    matchup_num = _get_date_index().get(current_date)
+    if matchup_num is None:
+        return None
 
-    return None
+    start_date, end_date, matchup_data = _MATCHUPS[matchup_num]
+    return {
+        "matchup_number": matchup_num,
+        "start_date": start_date,
+        "end_date": end_date,
+        "game_span": matchup_data["gameSpan"],
+        "games": matchup_data["games"],
+        "current_day_index": (current_date - start_date).days
+    }
 
 
 def get_matchup_by_number(matchup_number: int) -> Optional[dict]:
@@ -78,14 +139,14 @@ def get_matchup_by_number(matchup_number: int) -> Optional[dict]:
     Returns:
         Dict with matchup info or None if not found.
     """
-    schedule = _load_schedule().get("schedule", {})
-    matchup_data = schedule.get(str(matchup_number))
+    matchup = _get_matchups().get(matchup_number)
 
-    if matchup_data:
+    if matchup:
+        start_date, end_date, matchup_data = matchup
         return {
             "matchup_number": matchup_number,
-            "start_date": _parse_date(matchup_data["startDate"]),
-            "end_date": _parse_date(matchup_data["endDate"]),
+            "start_date": start_date,
+            "end_date": end_date,
             "game_span": matchup_data["gameSpan"],
             "games": matchup_data["games"]
         }
@@ -103,12 +164,7 @@ def get_team_games_in_matchup(team_abbrev: str, matchup_number: int) -> list[int
     Returns:
         List of day indices (0-indexed from matchup start) when the team plays.
     """
-    matchup = get_matchup_by_number(matchup_number)
-    if not matchup:
-        return []
-
-    team_games = matchup["games"].get(team_abbrev, {})
-    return sorted([int(day) for day in team_games.keys()])
+    return list(_get_game_days(matchup_number, team_abbrev))
 
 
 def get_remaining_games(team_abbrev: str, current_date: Optional[date] = None) -> int:
@@ -122,20 +178,18 @@ def get_remaining_games(team_abbrev: str, current_date: Optional[date] = None) -
     Returns:
         Number of remaining games in the current matchup.
     """
-    central_tz = pytz.timezone("US/Central")
     if current_date is None:
-        current_date = datetime.now(central_tz).date()
+        current_date = datetime.now(_CST).date()
 
     matchup = get_current_matchup(current_date)
     if not matchup:
         return 0
 
     current_day_index = matchup["current_day_index"]
-    team_games = matchup["games"].get(team_abbrev, {})
+    game_days = _get_game_days(matchup["matchup_number"], team_abbrev)
 
     # Count games on or after the current day
-    remaining = sum(1 for day in team_games.keys() if int(day) >= current_day_index)
-    return remaining
+    return len(game_days) - bisect_left(game_days, current_day_index)
 
 
 def get_total_games_in_matchup(team_abbrev: str, matchup_number: int) -> int:
@@ -177,16 +231,15 @@ def get_remaining_games_for_matchup(
         Number of remaining games. Returns total games if matchup hasn't started,
         0 if matchup has ended, otherwise games remaining from current day.
     """
-    central_tz = pytz.timezone("US/Central")
     if current_date is None:
-        current_date = datetime.now(central_tz).date()
+        current_date = datetime.now(_CST).date()
 
     matchup = get_matchup_by_number(matchup_number)
     if not matchup:
         return 0
 
-    team_games = matchup["games"].get(team_abbrev, {})
-    if not team_games:
+    game_days = _get_game_days(matchup_number, team_abbrev)
+    if not game_days:
         return 0
 
     start_date = matchup["start_date"]
@@ -194,7 +247,7 @@ def get_remaining_games_for_matchup(
 
     # If matchup hasn't started, all games are remaining
     if current_date < start_date:
-        return len(team_games)
+        return len(game_days)
 
     # If matchup has ended, no games remaining
     if current_date > end_date:
@@ -202,8 +255,7 @@ def get_remaining_games_for_matchup(
 
     # Calculate current day index and count remaining games
     current_day_index = (current_date - start_date).days
-    remaining = sum(1 for day in team_games.keys() if int(day) >= current_day_index)
-    return remaining
+    return len(game_days) - bisect_left(game_days, current_day_index)
 
 
 def get_matchup_dates(matchup_number: int) -> Optional[tuple[date, date]]:
@@ -257,26 +309,9 @@ def get_remaining_game_days(team_abbrev: str, current_date: Optional[date] = Non
         return []
 
     current_day_index = matchup["current_day_index"]
-    team_games = matchup["games"].get(team_abbrev, {})
-
-    return sorted([int(day) for day in team_games.keys() if int(day) >= current_day_index])
-
-
-def _find_b2b_pairs(game_days: list[int]) -> list[tuple[int, int]]:
-    """
-    Find consecutive day pairs (back-to-backs) in a list of game days.
-
-    Args:
-        game_days: Sorted list of day indices when team plays.
+    game_days = _get_game_days(matchup["matchup_number"], team_abbrev)
 
-    Returns:
-        List of (day1, day2) tuples representing back-to-back games.
-    """
-    b2b_pairs = []
-    for i in range(len(game_days) - 1):
-        if game_days[i + 1] - game_days[i] == 1:
-            b2b_pairs.append((game_days[i], game_days[i + 1]))
-    return b2b_pairs
+    return game_days[bisect_left(game_days, current_day_index):]
 
 
 def has_remaining_b2b(team_abbrev: str, current_date: Optional[date] = None) -> bool:
@@ -290,9 +325,7 @@ def has_remaining_b2b(team_abbrev: str, current_date: Optional[date] = None) ->
     Returns:
         True if the team has at least one remaining B2B sequence, False otherwise.
     """
-    remaining_days = get_remaining_game_days(team_abbrev, current_date)
-    b2b_pairs = _find_b2b_pairs(remaining_days)
-    return len(b2b_pairs) > 0
+    return _has_b2b(get_remaining_game_days(team_abbrev, current_date))
 
 
 def get_b2b_game_count(team_abbrev: str, current_date: Optional[date] = None) -> int:
@@ -311,15 +344,20 @@ def get_b2b_game_count(team_abbrev: str, current_date: Optional[date] = None) ->
         Example: If team has B2B on days 3-4 and 6-7, returns 4.
     """
     remaining_days = get_remaining_game_days(team_abbrev, current_date)
-    b2b_pairs = _find_b2b_pairs(remaining_days)
 
-    # Collect unique days that are part of B2Bs
-    b2b_days = set()
-    for day1, day2 in b2b_pairs:
-        b2b_days.add(day1)
-        b2b_days.add(day2)
+    # Every day in a run of 2+ consecutive game days is part of a B2B
+    b2b_count = 0
+    run_start = 0
+    n = len(remaining_days)
+    while run_start < n:
+        run_end = run_start
+        while run_end + 1 < n and remaining_days[run_end + 1] - remaining_days[run_end] == 1:
+            run_end += 1
+        if run_end > run_start:
+            b2b_count += run_end - run_start + 1
+        run_start = run_end + 1
 
-    return len(b2b_days)
+    return b2b_count
 
 
 def get_teams_with_b2b(current_date: Optional[date] = None) -> list[str]:
@@ -339,24 +377,36 @@ def get_teams_with_b2b(current_date: Optional[date] = None) -> list[str]:
     if not matchup:
         return []
 
-    teams_with_b2b = []
-    for team_abbrev in matchup["games"].keys():
-        if has_remaining_b2b(team_abbrev, current_date):
-            teams_with_b2b.append(team_abbrev)
+    current_day_index = matchup["current_day_index"]
+
+    # One pass over the cached lists: skip past days, stop at the first B2B
+    teams_with_b2b = [
+        team_abbrev
+        for team_abbrev, game_days in _get_matchup_game_days(matchup["matchup_number"]).items()
+        if _has_b2b(game_days, bisect_left(game_days, current_day_index))
+    ]
 
     return sorted(teams_with_b2b)
 
 
+@lru_cache(maxsize=512)
+def _get_games_on_date(date: date) -> tuple[dict, ...]:
+    """Get the games on a date as an immutable tuple, cached per date."""
+    schedule = _load_schedule_v2()
+    return tuple(schedule.get(date.strftime("%m/%d/%Y"), []))
+
+
 def get_upcoming_games_on_date(date: date) -> list[dict]:
     """
     Get the upcoming games on a specific date.
 
+    Cached per date; the schedule file is static for the season. Each call
+    returns a fresh list, so callers can't alter the cached games.
+
     Args:
         date: The date to check.
 
     Returns:
         List of upcoming games on the date.
     """
-    schedule = _load_schedule_v2()
-    games = schedule.get(date.strftime("%m/%d/%Y"), [])
-    return games
\ No newline at end of file
+    return list(_get_games_on_date(date))
\ No newline at end of file
@@ -2,9 +2,13 @@ import json
 import unicodedata
 import requests
 from datetime import datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
-import pytz
+import pandas as pd
 from peewee import fn
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from db.models.season2.cumulative_player_stats import CumulativePlayerStats
 from nba_api.stats.endpoints import leagueleaders
@@ -14,7 +18,30 @@ from nba_api.stats.endpoints import leagueleaders
 YEAR = 2026
 LEAGUE_ID = 993431466
 
+_CST = ZoneInfo("US/Central")
 
+# ESPN session that retries transient gateway errors with backoff
+_session = requests.Session()
+_session.mount(
+    'https://',
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+)
+
+# x-fantasy-filter for the top 750 players by percent owned; constant, so encoded once
+_ESPN_FILTER_HEADER = json.dumps(
+    {
+        "players": {
+            "filterSlotIds": {"value": []},
+            "limit": 750,
+            "sortPercOwned": {"sortPriority": 1, "sortAsc": False},
+            "sortDraftRanks": {"sortPriority": 2, "sortAsc": True, "value": "STANDARD"}
+        }
+    },
+    separators=(',', ':'),
+)
+
+
+@lru_cache(maxsize=4096)
 def remove_diacritics(s: str) -> str:
     """Removes diacritics from a string for name matching"""
     return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
@@ -27,17 +54,9 @@ def get_espn_rostered_data(year: int, league_id: int) -> dict:
         'scoringPeriodId': 0,
     }
     endpoint = f'https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba/seasons/{year}/segments/0/leagues/{league_id}'
-    filters = {
-        "players": {
-            "filterSlotIds": {"value": []},
-            "limit": 750,
-            "sortPercOwned": {"sortPriority": 1, "sortAsc": False},
-            "sortDraftRanks": {"sortPriority": 2, "sortAsc": True, "value": "STANDARD"}
-        }
-    }
-    headers = {'x-fantasy-filter': json.dumps(filters)}
+    headers = {'x-fantasy-filter': _ESPN_FILTER_HEADER}
 
-    response = requests.get(endpoint, params=params, headers=headers)
+    response = _session.get(endpoint, params=params, headers=headers)
     data = response.json()
     players = data.get('players', [])
     players = [x.get('player', x) for x in players]
@@ -53,8 +72,8 @@ def get_espn_rostered_data(year: int, league_id: int) -> dict:
     return cleaned_data
 
 
-def calculate_fantasy_points(stats: dict) -> int:
-    """Formula for the fantasy points of a player"""
+def calculate_fantasy_points(stats: pd.DataFrame) -> pd.Series:
+    """Formula for the fantasy points of every player, computed column-wise"""
     points_score = stats['pts']
     rebounds_score = stats['reb']
     assists_score = stats['ast'] * 2
@@ -63,7 +82,29 @@ def calculate_fantasy_points(stats: dict) -> int:
     three_pointers_score = stats['fg3m']
     fg_eff_score = (stats['fgm'] * 2) - stats['fga']
     ft_eff_score = stats['ftm'] - stats['fta']
-    return int(points_score + rebounds_score + assists_score + stocks_score + turnovers_score + three_pointers_score + fg_eff_score + ft_eff_score)
+    return points_score + rebounds_score + assists_score + stocks_score + turnovers_score + three_pointers_score + fg_eff_score + ft_eff_score
+
+
+# NBA API LeagueLeaders column -> cumulative stats key
+LEADER_COLUMNS = {
+    'PLAYER_ID': 'id',
+    'PLAYER': 'name',
+    'TEAM': 'team',
+    'MIN': 'min',
+    'PTS': 'pts',
+    'REB': 'reb',
+    'AST': 'ast',
+    'STL': 'stl',
+    'BLK': 'blk',
+    'TOV': 'tov',
+    'FGM': 'fgm',
+    'FGA': 'fga',
+    'FG3M': 'fg3m',
+    'FG3A': 'fg3a',
+    'FTM': 'ftm',
+    'FTA': 'fta',
+    'GP': 'gp',
+}
 
 
 def fetch_nba_fpts_data(rostered_data: dict) -> dict:
@@ -73,64 +114,39 @@ def fetch_nba_fpts_data(rostered_data: dict) -> dict:
         per_mode48='Totals',
         stat_category_abbreviation='PTS'
     )
-    updated = leaders.get_normalized_dict()['LeagueLeaders']
+    df = leaders.get_data_frames()[0][list(LEADER_COLUMNS)].rename(columns=LEADER_COLUMNS)
+    df['rost_pct'] = df['name'].map(remove_diacritics).map(rostered_data).fillna(0)
+    df['fpts'] = calculate_fantasy_points(df).astype(int)
 
     # Create a new dictionary with the id as the key
-    updated_dict = {}
-    for player in updated:
-        player_name = player['PLAYER']
-        rost_pct = rostered_data.get(remove_diacritics(player_name), 0)
-
-        updated_dict[player['PLAYER_ID']] = {
-            'id': player['PLAYER_ID'],
-            'name': player_name,
-            'team': player['TEAM'],
-            'min': player['MIN'],
-            'pts': player['PTS'],
-            'reb': player['REB'],
-            'ast': player['AST'],
-            'stl': player['STL'],
-            'blk': player['BLK'],
-            'tov': player['TOV'],
-            'fgm': player['FGM'],
-            'fga': player['FGA'],
-            'fg3m': player['FG3M'],
-            'fg3a': player['FG3A'],
-            'ftm': player['FTM'],
-            'fta': player['FTA'],
-            'gp': player['GP'],
-            'rost_pct': rost_pct
-        }
-
-    return updated_dict
+    return {player['id']: player for player in df.to_dict('records')}
 
 
 def get_latest_gp_by_player() -> dict:
     """Gets the most recent GP value for each player from the database"""
-    # Get the latest record for each player by finding max date per player
-    subquery = (
+    # Number each player's rows newest-first and keep the first one
+    ranked = (
         CumulativePlayerStats
         .select(
             CumulativePlayerStats.id,
-            fn.MAX(CumulativePlayerStats.date).alias('max_date')
+            CumulativePlayerStats.gp,
+            fn.ROW_NUMBER().over(
+                partition_by=[CumulativePlayerStats.id],
+                order_by=[CumulativePlayerStats.date.desc()]
+            ).alias('rn')
         )
-        .group_by(CumulativePlayerStats.id)
+        .alias('ranked')
     )
 
-    # Join back to get the full record for each player's latest date
     latest_records = (
         CumulativePlayerStats
-        .select(CumulativePlayerStats.id, CumulativePlayerStats.gp)
-        .join(
-            subquery,
-            on=(
-                (CumulativePlayerStats.id == subquery.c.id) &
-                (CumulativePlayerStats.date == subquery.c.max_date)
-            )
-        )
+        .select(ranked.c.id, ranked.c.gp)
+        .from_(ranked)
+        .where(ranked.c.rn == 1)
+        .tuples()
     )
 
-    return {record.id: record.gp for record in latest_records}
+    return dict(latest_records)
 
 
 def get_players_who_played(api_data: dict, db_gp_map: dict) -> list[dict]:
@@ -152,8 +168,7 @@ def main():
     print("Starting cumulative player stats ETL...")
 
     # Get yesterday's date (stats are for the previous day)
-    central_tz = pytz.timezone('US/Central')
-    yesterday = datetime.now(central_tz) - timedelta(days=1)
+    yesterday = datetime.now(_CST) - timedelta(days=1)
     date = yesterday.date()
     print(f"Processing stats for date: {date}")
 
@@ -184,13 +199,12 @@ def main():
     print("Inserting cumulative stats for players who played...")
     entries = []
     for player in players_who_played:
-        fpts = calculate_fantasy_points(player)
         entries.append({
             'id': player['id'],
             'name': player['name'],
             'team': player['team'],
             'date': date,
-            'fpts': fpts,
+            'fpts': player['fpts'],
             'pts': player['pts'],
             'reb': player['reb'],
             'ast': player['ast'],
@@ -215,36 +229,32 @@ def main():
     # Update ranks for ALL players based on their latest fantasy points
     print("Calculating ranks for all players...")
 
-    # Get the latest entry for each player
-    subquery = (
+    # Get the latest entry for each player, ordered by fpts
+    ranked = (
         CumulativePlayerStats
         .select(
             CumulativePlayerStats.id,
-            fn.MAX(CumulativePlayerStats.date).alias('max_date')
+            CumulativePlayerStats.date,
+            CumulativePlayerStats.fpts,
+            fn.ROW_NUMBER().over(
+                partition_by=[CumulativePlayerStats.id],
+                order_by=[CumulativePlayerStats.date.desc()]
+            ).alias('rn')
         )
-        .group_by(CumulativePlayerStats.id)
+        .alias('ranked')
     )
 
-    # Get full records for each player's latest entry, ordered by fpts
     latest_entries = list(
         CumulativePlayerStats
-        .select()
-        .join(
-            subquery,
-            on=(
-                (CumulativePlayerStats.id == subquery.c.id) &
-                (CumulativePlayerStats.date == subquery.c.max_date)
-            )
-        )
-        .order_by(CumulativePlayerStats.fpts.desc())
+        .select(ranked.c.id, ranked.c.date)
+        .from_(ranked)
+        .where(ranked.c.rn == 1)
+        .order_by(ranked.c.fpts.desc())
+        .tuples()
     )
 
-    # Update rank for each player's latest entry
-    for i, player in enumerate(latest_entries, start=1):
-        CumulativePlayerStats.update(rank=i).where(
-            (CumulativePlayerStats.id == player.id) &
-            (CumulativePlayerStats.date == player.date)
-        ).execute()
+    # Update rank for each player's latest entry in a single UPDATE ... FROM (VALUES ...)
+    CumulativePlayerStats.update_ranks(latest_entries)
 
     print(f"Updated ranks for {len(latest_entries)} players")
     print("ETL process completed successfully")
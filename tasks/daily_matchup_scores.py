@@ -11,55 +11,47 @@ Usage:
 """
 
 import os
-import json
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-import pytz
 from playhouse.db_url import connect
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from db.models.season2.daily_matchup_score import DailyMatchupScore
+from services.schedule_service import get_current_matchup
 
 
 # ESPN API Configuration
 ESPN_FANTASY_ENDPOINT = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba/seasons/{}/segments/0/leagues/{}"
 
-# Schedule file path
-SCHEDULE_PATH = os.path.join(
-    os.path.dirname(__file__), "..", "static", "schedule25-26.json"
+# Leagues fetched from ESPN concurrently
+MAX_ESPN_WORKERS = 16
+
+# Shared keep-alive connection pool for ESPN requests, one connection per
+# worker, retrying transient gateway errors with backoff
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=MAX_ESPN_WORKERS,
+        pool_maxsize=MAX_ESPN_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
 )
 
+# League responses already fetched this run, keyed by
+# (league_id, year, espn_s2, swid). The payload covers every team in the
+# league, so saved teams that share a league and credentials reuse one
+# request; teams with their own credentials for a private league don't
+# see a response fetched with someone else's.
+_league_data_cache: dict[tuple[int, int, str, str], dict] = {}
 
-def load_schedule() -> dict:
-    """Load matchup schedule from JSON file."""
-    with open(SCHEDULE_PATH, "r") as f:
-        return json.load(f)
-
-
-def get_current_matchup_info(current_date: date) -> Optional[dict]:
-    """
-    Determine current matchup period and day index.
-
-    Returns:
-        dict with matchup_number, start_date, end_date, day_index
-        or None if no active matchup
-    """
-    schedule = load_schedule().get("schedule", {})
-
-    for matchup_num, matchup_data in schedule.items():
-        start = datetime.strptime(matchup_data["startDate"], "%m/%d/%Y").date()
-        end = datetime.strptime(matchup_data["endDate"], "%m/%d/%Y").date()
-
-        if start <= current_date <= end:
-            return {
-                "matchup_number": int(matchup_num),
-                "start_date": start,
-                "end_date": end,
-                "day_index": (current_date - start).days,
-            }
-
-    return None
+_CST = ZoneInfo("US/Central")
 
 
 def get_all_saved_teams() -> list[dict]:
@@ -76,25 +68,37 @@ def get_all_saved_teams() -> list[dict]:
     backend_db = connect(backend_db_url)
 
     try:
+        # league_info is a JSON string; let Postgres extract the fields we need.
+        # The int casts are guarded (digits only, fits int4) so one malformed row
+        # is skipped below instead of failing the whole query
         cursor = backend_db.execute_sql(
-            """
-            SELECT team_id, league_info
+            r"""
+            SELECT
+                team_id,
+                CASE WHEN (league_info::jsonb ->> 'league_id') ~ '^\d{1,9}$'
+                    THEN (league_info::jsonb ->> 'league_id')::int END,
+                league_info::jsonb ->> 'team_name',
+                league_info::jsonb ->> 'espn_s2',
+                league_info::jsonb ->> 'swid',
+                CASE WHEN (league_info::jsonb ->> 'year') ~ '^\d{1,9}$'
+                    THEN (league_info::jsonb ->> 'year')::int END
             FROM usr.teams
             """
         )
 
         teams = []
-        for row in cursor.fetchall():
-            team_id, league_info_json = row
-            league_info = json.loads(league_info_json)
+        for team_id, league_id, team_name, espn_s2, swid, year in cursor.fetchall():
+            if league_id is None or year is None:
+                print(f"Skipping team_id={team_id}: malformed league_info")
+                continue
             teams.append(
                 {
                     "team_id": team_id,
-                    "league_id": league_info["league_id"],
-                    "team_name": league_info["team_name"],
-                    "espn_s2": league_info["espn_s2"],
-                    "swid": league_info["swid"],
-                    "year": league_info["year"],
+                    "league_id": league_id,
+                    "team_name": team_name,
+                    "espn_s2": espn_s2,
+                    "swid": swid,
+                    "year": year,
                 }
             )
 
@@ -103,19 +107,22 @@ def get_all_saved_teams() -> list[dict]:
         backend_db.close()
 
 
-def fetch_matchup_from_espn(
+def fetch_league_from_espn(
     league_id: int,
-    team_name: str,
     espn_s2: str,
     swid: str,
     year: int,
-    matchup_period: int,
 ) -> Optional[dict]:
     """
-    Fetch matchup data from ESPN API for a specific team.
+    Fetch the league's teams and schedule from ESPN, reusing earlier responses.
 
-    Returns dict with team scores and opponent info, or None on error.
+    Responses are cached per set of credentials, and failed requests are not
+    cached, so another saved team in the same league can retry with its own.
     """
+    cache_key = (league_id, year, espn_s2, swid)
+    if cache_key in _league_data_cache:
+        return _league_data_cache[cache_key]
+
     params = {"view": ["mTeam", "mMatchup", "mSchedule"]}
 
     cookies = {"espn_s2": espn_s2, "SWID": swid}
@@ -123,13 +130,34 @@ def fetch_matchup_from_espn(
     endpoint = ESPN_FANTASY_ENDPOINT.format(year, league_id)
 
     try:
-        response = requests.get(endpoint, params=params, cookies=cookies, timeout=30)
+        response = _session.get(endpoint, params=params, cookies=cookies, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
     except Exception as e:
         print(f"  ESPN API error for league {league_id}: {e}")
         return None
 
+    _league_data_cache[cache_key] = data
+    return data
+
+
+def fetch_matchup_from_espn(
+    league_id: int,
+    team_name: str,
+    espn_s2: str,
+    swid: str,
+    year: int,
+    matchup_period: int,
+) -> Optional[dict]:
+    """
+    Fetch matchup data from ESPN API for a specific team.
+
+    Returns dict with team scores and opponent info, or None on error.
+    """
+    data = fetch_league_from_espn(league_id, espn_s2, swid, year)
+    if data is None:
+        return None
+
     # Find our team
     teams = data.get("teams", [])
     our_team = None
@@ -191,19 +219,43 @@ def fetch_matchup_from_espn(
     }
 
 
-def upsert_daily_score(
+def fetch_league_matchups(league_teams: list[dict], matchup_period: int) -> list[tuple[dict, Optional[dict]]]:
+    """
+    Fetch matchup data for saved teams that share a league.
+
+    Teams are fetched in order within one worker, so after the first success
+    the rest of the league's teams with the same credentials are served from
+    the league cache.
+
+    Returns list of (team, espn_data) pairs; espn_data is None on failure.
+    """
+    results = []
+    for team in league_teams:
+        try:
+            espn_data = fetch_matchup_from_espn(
+                league_id=team["league_id"],
+                team_name=team["team_name"],
+                espn_s2=team["espn_s2"],
+                swid=team["swid"],
+                year=team["year"],
+                matchup_period=matchup_period,
+            )
+        except Exception as e:
+            print(f"  Error fetching team_id={team['team_id']}: {e}")
+            espn_data = None
+        results.append((team, espn_data))
+    return results
+
+
+def build_daily_score_record(
     team_id: int,
     matchup_period: int,
     espn_data: dict,
     snapshot_date: date,
     day_index: int,
-) -> None:
-    """
-    Insert or update daily matchup score record.
-
-    Uses ON CONFLICT for idempotency.
-    """
-    record = {
+) -> dict:
+    """Build a daily matchup score row from fetched ESPN data."""
+    return {
         "team_id": team_id,
         "team_name": espn_data["team_name"],
         "matchup_period": matchup_period,
@@ -214,19 +266,29 @@ def upsert_daily_score(
         "opponent_current_score": espn_data["opponent_current_score"],
     }
 
+
+def upsert_daily_scores(records: list[dict]) -> None:
+    """
+    Insert or update daily matchup score records in a single statement.
+
+    Uses ON CONFLICT for idempotency.
+    """
+    if not records:
+        return
+
     # Upsert: insert or update on conflict
-    DailyMatchupScore.insert(record).on_conflict(
+    DailyMatchupScore.insert_many(records).on_conflict(
         conflict_target=[
             DailyMatchupScore.team_id,
             DailyMatchupScore.matchup_period,
             DailyMatchupScore.date,
         ],
-        update={
-            "current_score": record["current_score"],
-            "opponent_current_score": record["opponent_current_score"],
-            "team_name": record["team_name"],
-            "opponent_team_name": record["opponent_team_name"],
-        },
+        preserve=[
+            DailyMatchupScore.current_score,
+            DailyMatchupScore.opponent_current_score,
+            DailyMatchupScore.team_name,
+            DailyMatchupScore.opponent_team_name,
+        ],
     ).execute()
 
 
@@ -235,20 +297,19 @@ def main():
     print("Starting daily matchup scores ETL...")
 
     # Use Central timezone (NBA games end late)
-    central_tz = pytz.timezone("US/Central")
-    now = datetime.now(central_tz)
+    now = datetime.now(_CST)
     today = now.date()
 
     print(f"Processing for date: {today}")
 
     # Get current matchup info
-    matchup_info = get_current_matchup_info(today)
+    matchup_info = get_current_matchup(today)
     if not matchup_info:
         print("No active matchup period. Exiting.")
         return
 
     print(
-        f"Current matchup period: {matchup_info['matchup_number']}, day {matchup_info['day_index']}"
+        f"Current matchup period: {matchup_info['matchup_number']}, day {matchup_info['current_day_index']}"
     )
 
     # Get all saved teams
@@ -260,42 +321,60 @@ def main():
         print("No teams to process. Exiting.")
         return
 
-    # Process each team
-    success_count = 0
-    error_count = 0
-
+    # Group teams by league so each league is fetched by a single worker
+    leagues: dict[tuple[int, int], list[dict]] = {}
     for team in teams:
-        try:
-            print(f"Processing team_id={team['team_id']}: {team['team_name']}")
+        leagues.setdefault((team["league_id"], team["year"]), []).append(team)
 
-            espn_data = fetch_matchup_from_espn(
-                league_id=team["league_id"],
-                team_name=team["team_name"],
-                espn_s2=team["espn_s2"],
-                swid=team["swid"],
-                year=team["year"],
-                matchup_period=matchup_info["matchup_number"],
-            )
+    # Fetch leagues concurrently, then write every score in one upsert
+    records = []
+    error_count = 0
 
-            if espn_data:
-                upsert_daily_score(
-                    team_id=team["team_id"],
-                    matchup_period=matchup_info["matchup_number"],
-                    espn_data=espn_data,
-                    snapshot_date=today,
-                    day_index=matchup_info["day_index"],
-                )
+    with ThreadPoolExecutor(max_workers=MAX_ESPN_WORKERS) as executor:
+        futures = [
+            executor.submit(fetch_league_matchups, league_teams, matchup_info["matchup_number"])
+            for league_teams in leagues.values()
+        ]
+
+        for future in as_completed(futures):
+            for team, espn_data in future.result():
+                try:
+                    print(f"Processing team_id={team['team_id']}: {team['team_name']}")
+
+                    if espn_data:
+                        records.append(build_daily_score_record(
+                            team_id=team["team_id"],
+                            matchup_period=matchup_info["matchup_number"],
+                            espn_data=espn_data,
+                            snapshot_date=today,
+                            day_index=matchup_info["current_day_index"],
+                        ))
+                        print(
+                            f"  -> Score: {espn_data['current_score']} vs {espn_data['opponent_current_score']}"
+                        )
+                    else:
+                        error_count += 1
+                        print("  -> Failed to fetch data")
+
+                except Exception as e:
+                    error_count += 1
+                    print(f"  -> Error: {e}")
+
+    success_count = 0
+    try:
+        upsert_daily_scores(records)
+        success_count = len(records)
+    except Exception as e:
+        # One bad row fails the whole batch; retry row by row so only the
+        # teams that actually fail are counted as errors
+        print(f"Error saving {len(records)} scores in one batch ({e}); retrying individually")
+        for record in records:
+            try:
+                upsert_daily_scores([record])
                 success_count += 1
-                print(
-                    f"  -> Score: {espn_data['current_score']} vs {espn_data['opponent_current_score']}"
-                )
-            else:
+            except Exception as e:
                 error_count += 1
-                print("  -> Failed to fetch data")
-
-        except Exception as e:
-            error_count += 1
-            print(f"  -> Error: {e}")
+                print(f"  -> Error saving team_id={record['team_id']}: {e}")
 
     print(f"\nCompleted: {success_count} success, {error_count} errors")
 
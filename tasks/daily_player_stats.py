@@ -1,13 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from datetime import datetime
+from datetime import datetime, date
+from functools import lru_cache
+from pathlib import Path
 import json
-import unicodedata
-import pytz
+import tempfile
+import time
+from zoneinfo import ZoneInfo
+import orjson
 import requests
-from nba_api.stats.endpoints import scoreboardv2, playergamelogs
+from nba_api.stats.endpoints import playergamelogs
 import pandas as pd
+from peewee import chunked
+from db.base import db
 from db.models.season2.daily_player_stats import DailyPlayerStats
+from utils.text import strip_combining_marks
 
+_CST = ZoneInfo("US/Central")
 
 def normalize_name(name: str) -> str:
 	"""
@@ -17,15 +26,17 @@ def normalize_name(name: str) -> str:
 		"Nikola Jokić" -> "nikola jokic"
 		"Luka Dončić" -> "luka doncic"
 	"""
-	normalized = unicodedata.normalize('NFD', name)
-	ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-	return ascii_name.lower().strip()
+	# Decompose, then drop the combining marks in one C-level translate pass
+	return strip_combining_marks(name).lower().strip()
 
-def get_game_ids(date: str) -> list[str]:
-	scoreboard = scoreboardv2.ScoreboardV2(game_date=date)
-	games = scoreboard.get_dict()['resultSets'][0]['rowSet']
-	game_ids = [game[2] for game in games]
-	return game_ids
+# x-fantasy-filter for the top 750 players by percent owned; constant, so encoded once
+_ESPN_FILTER_HEADER = json.dumps(
+	{"players":{"filterSlotIds":{"value":[]},"limit": 750, "sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":2,"sortAsc":True,"value":"STANDARD"}}},
+	separators=(',', ':'),
+)
+
+# (connect, read) seconds for the ESPN request, so a stalled socket can't hang the task
+ESPN_TIMEOUT = (10, 30)
 
 def get_espn_player_data(year: int, league_id: int) -> dict:
 	"""
@@ -39,11 +50,10 @@ def get_espn_player_data(year: int, league_id: int) -> dict:
 			'scoringPeriodId': 0,
 	}
 	endpoint = 'https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba/seasons/{}/segments/0/leagues/{}'.format(year, league_id)
-	filters = {"players":{"filterSlotIds":{"value":[]},"limit": 750, "sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":2,"sortAsc":True,"value":"STANDARD"}}}
-	headers = {'x-fantasy-filter': json.dumps(filters)}
+	headers = {'x-fantasy-filter': _ESPN_FILTER_HEADER}
 
-	data = requests.get(endpoint, params=params, headers=headers).json()
-	data = data['players']
+	response = requests.get(endpoint, params=params, headers=headers, timeout=ESPN_TIMEOUT)
+	data = orjson.loads(response.content)['players']
 	data = [x.get('player', x) for x in data]
 
 	cleaned_data = {}
@@ -57,36 +67,84 @@ def get_espn_player_data(year: int, league_id: int) -> dict:
 
 	return cleaned_data
 
-# Helper function to convert minutes from MM:SS format to integer minutes
-def minutes_to_int(min_str: str) -> int:
-	if isinstance(min_str, (int, float)):
-		return int(min_str)
-	if ':' in str(min_str):
-		parts = str(min_str).split(':')
-		return int(parts[0])
-	return int(min_str)
+# Helper function to convert a column of minutes (numeric or MM:SS strings) to integer minutes
+def minutes_to_int(minutes: pd.Series) -> pd.Series:
+	"""Whole minutes per row; null, blank or unparseable values become 0."""
+	if pd.api.types.is_numeric_dtype(minutes):
+		return minutes.fillna(0).astype('int64')
+	whole_minutes = minutes.astype(str).str.split(':', n=1).str[0]
+	return pd.to_numeric(whole_minutes, errors='coerce').fillna(0).astype('int64')
+
+# Game-log stat columns stored as integers
+INT_STAT_COLUMNS = ["PLAYER_ID", "PTS", "REB", "AST", "STL", "BLK", "TOV", "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA"]
+
+# Game-log column -> daily_player_stats column, for the rows that get inserted
+DAILY_STATS_COLUMNS = {
+	"PLAYER_ID": "id",
+	"espn_id": "espn_id",
+	"PLAYER_NAME": "name",
+	"TEAM_ABBREVIATION": "team",
+	"FPTS_INT": "fpts",
+	"PTS": "pts",
+	"REB": "reb",
+	"AST": "ast",
+	"STL": "stl",
+	"BLK": "blk",
+	"TOV": "tov",
+	"FGM": "fgm",
+	"FGA": "fga",
+	"FG3M": "fg3m",
+	"FG3A": "fg3a",
+	"FTM": "ftm",
+	"FTA": "fta",
+	"MIN_INT": "min",
+	"rost_pct": "rost_pct",
+}
 
 year = 2026
 league_id = 993431466
 
-espn_player_data = get_espn_player_data(year, league_id)
+# Re-runs within this window reuse the ESPN player data cached on disk
+ESPN_CACHE_TTL_SECONDS = 6 * 60 * 60
 
-def get_espn_info(player_name: str) -> dict | None:
+def load_espn_player_data(year: int, league_id: int) -> dict:
 	"""
-	Get ESPN info (espn_id, rost_pct) for a player by name.
+	get_espn_player_data with a per-day cache, keyed by today's date in CST.
 
-	Uses normalized name matching to handle diacritics (e.g., Jokić -> jokic).
+	The response is written under the temp dir keyed by (year, league_id, date)
+	and reused for ESPN_CACHE_TTL_SECONDS, so re-runs skip the 750-player request.
+	It is also memoized in-process on the same key, so several runs in one
+	process fetch once per day.
+	"""
+	return _load_espn_player_data_for_day(year, league_id, datetime.now(_CST).date())
 
-	Args:
-		player_name: The player's name from NBA API
+@lru_cache(maxsize=1)
+def _load_espn_player_data_for_day(year: int, league_id: int, day: date) -> dict:
+	cache_path = Path(tempfile.gettempdir()) / f"espn_players_{year}_{league_id}_{day:%Y%m%d}.json"
+	try:
+		if time.time() - cache_path.stat().st_mtime < ESPN_CACHE_TTL_SECONDS:
+			return orjson.loads(cache_path.read_bytes())
+	except (OSError, ValueError):
+		pass
 
-	Returns:
-		dict with 'espn_id' and 'rost_pct', or None if not found
-	"""
-	normalized = normalize_name(player_name)
-	return espn_player_data.get(normalized)
+	data = get_espn_player_data(year, league_id)
+	try:
+		cache_path.write_bytes(orjson.dumps(data))
+	except OSError:
+		pass
+	return data
+
+def get_game_logs(date_str: str, season: str) -> pd.DataFrame:
+	"""Player game logs for one MM/DD/YYYY date in the given season."""
+	game_logs = playergamelogs.PlayerGameLogs(
+		date_from_nullable=date_str,
+		date_to_nullable=date_str,
+		season_nullable=season
+	)
+	return game_logs.player_game_logs.get_data_frame()
 
-def calculate_fantasy_points(stats: pd.Series) -> float:
+def calculate_fantasy_points(stats: pd.DataFrame) -> pd.Series:
+	"""Fantasy points for every row, computed column-wise."""
 	points_score = stats['PTS']
 	rebounds_score = stats['REB']
 	assists_score = stats['AST'] * 2
@@ -99,12 +157,11 @@ def calculate_fantasy_points(stats: pd.Series) -> float:
 	return points_score + rebounds_score + assists_score + stocks_score + turnovers_score + three_pointers_score + fg_eff_score + ft_eff_score
 
 
-def main():
-	central_tz = pytz.timezone('US/Central')
-	yesterday = datetime.now(central_tz) - timedelta(days=1)
+def main(days_back: int = 1):
+	"""Load the game logs from `days_back` days ago (CST) into daily_player_stats."""
+	yesterday = datetime.now(_CST) - timedelta(days=days_back)
 	game_date = yesterday.date()
 	
-	# Format date as YYYYMMDD for scoreboard
 	# Format date as MM/DD/YYYY for playergamelogs
 	date_str = yesterday.strftime('%m/%d/%Y')
 	
@@ -115,12 +172,13 @@ def main():
 		if yesterday.month < 8:  # Before August, use previous season
 			season = f"{yesterday.year - 1}-{str(yesterday.year)[-2:]}"
 		
-		game_logs = playergamelogs.PlayerGameLogs(
-			date_from_nullable=date_str,
-			date_to_nullable=date_str,
-			season_nullable=season
-		)
-		stats = game_logs.player_game_logs.get_data_frame()
+		# The ESPN and NBA requests hit different hosts and don't depend on each
+		# other, so overlap them instead of paying both latencies back to back
+		with ThreadPoolExecutor(max_workers=2) as executor:
+			espn_future = executor.submit(load_espn_player_data, year, league_id)
+			logs_future = executor.submit(get_game_logs, date_str, season)
+			stats = logs_future.result()
+			espn_player_data = espn_future.result()
 		
 		if stats.empty:
 			print(f"No player stats found for {date_str}")
@@ -128,49 +186,62 @@ def main():
 		
 		print(f"Found {len(stats)} player game logs for {date_str}")
 		
+		# Convert minutes once for the whole column and drop players who didn't
+		# play (blank/null/zero minutes) in one masked step, before any other
+		# per-row work is done on them
+		stats.loc[:, "MIN_INT"] = minutes_to_int(stats["MIN"])
+		stats = stats[stats["MIN_INT"] > 0].copy()
+		
+		# Cast the stat columns once up front so rows can be read off as-is; the
+		# API can hand back float columns with NaN holes, which count as 0
+		stats[INT_STAT_COLUMNS] = stats[INT_STAT_COLUMNS].fillna(0).astype('int64')
+		
 		# Calculate fantasy scores
-		stats.loc[:, "fantasyScore"] = stats.apply(calculate_fantasy_points, axis=1)
+		stats.loc[:, "fantasyScore"] = calculate_fantasy_points(stats)
+		stats.loc[:, "FPTS_INT"] = stats["fantasyScore"].round().astype('int64')
 		
-		for _, row in stats.iterrows():
-			# Skip players who didn't play (indicated by blank/null/empty minutes)
-			minutes_value = row['MIN']
-			
-			# Check for null, NaN, empty string, or None
-			if pd.isna(minutes_value) or minutes_value == '' or minutes_value is None:
-				continue
-			
-			# Convert to integer and skip if it's 0 (player didn't play)
-			minutes_int = minutes_to_int(minutes_value)
-			if minutes_int == 0:
-				continue
-			
-			player_name = row['PLAYER_NAME']
-			espn_info = get_espn_info(player_name)
-			espn_id = espn_info['espn_id'] if espn_info else None
-			rost_pct = espn_info['rost_pct'] if espn_info else None
-
-			DailyPlayerStats.create(
-				id=int(row['PLAYER_ID']),
-				espn_id=espn_id,
-				name=player_name,
-				team=row['TEAM_ABBREVIATION'],
-				date=game_date,
-				fpts=int(round(row['fantasyScore'])),
-				pts=int(row['PTS']),
-				reb=int(row['REB']),
-				ast=int(row['AST']),
-				stl=int(row['STL']),
-				blk=int(row['BLK']),
-				tov=int(row['TOV']),
-				fgm=int(row['FGM']),
-				fga=int(row['FGA']),
-				fg3m=int(row['FG3M']),
-				fg3a=int(row['FG3A']),
-				ftm=int(row['FTM']),
-				fta=int(row['FTA']),
-				min=minutes_int,
-				rost_pct=rost_pct
-			)
+		# Join ESPN info (espn_id, rost_pct) by normalized name for the whole
+		# column up front; normalization handles diacritics (Jokić -> jokic).
+		# Object columns keep unmatched players as None rather than NaN.
+		espn_info = stats["PLAYER_NAME"].map(normalize_name).map(espn_player_data.get)
+		stats["espn_id"] = pd.Series([info['espn_id'] if info else None for info in espn_info], index=stats.index, dtype=object)
+		stats["rost_pct"] = pd.Series([info['rost_pct'] if info else None for info in espn_info], index=stats.index, dtype=object)
+		
+		# Rename straight to the model's columns and hand the records to insert_many
+		rows = (
+			stats[list(DAILY_STATS_COLUMNS)]
+			.rename(columns=DAILY_STATS_COLUMNS)
+			.assign(date=game_date)
+			.to_dict('records')
+		)
+
+		# Upsert in batches instead of one round-trip per player; ON CONFLICT
+		# on (id, date) makes re-running the same day idempotent
+		with db.atomic():
+			for batch in chunked(rows, 100):
+				DailyPlayerStats.insert_many(batch).on_conflict(
+					conflict_target=[DailyPlayerStats.id, DailyPlayerStats.date],
+					preserve=[
+						DailyPlayerStats.espn_id,
+						DailyPlayerStats.name,
+						DailyPlayerStats.team,
+						DailyPlayerStats.fpts,
+						DailyPlayerStats.pts,
+						DailyPlayerStats.reb,
+						DailyPlayerStats.ast,
+						DailyPlayerStats.stl,
+						DailyPlayerStats.blk,
+						DailyPlayerStats.tov,
+						DailyPlayerStats.fgm,
+						DailyPlayerStats.fga,
+						DailyPlayerStats.fg3m,
+						DailyPlayerStats.fg3a,
+						DailyPlayerStats.ftm,
+						DailyPlayerStats.fta,
+						DailyPlayerStats.min,
+						DailyPlayerStats.rost_pct,
+					],
+				).execute()
 	except Exception as e:
 		print(f"Error getting player game logs: {e}")
 		import traceback
@@ -178,4 +249,11 @@ def main():
 		raise
 
 if __name__ == "__main__":
-	main()
\ No newline at end of file
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Load a day of player game logs into daily_player_stats")
+	parser.add_argument("--days-back", type=int, default=1, help="How many days before today (CST) to load (default: 1)")
+
+	args = parser.parse_args()
+
+	main(days_back=args.days_back)
\ No newline at end of file
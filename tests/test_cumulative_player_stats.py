@@ -0,0 +1,29 @@
+"""CumulativePlayerStats.update_ranks; renders SQL only, no database needed."""
+
+from datetime import date
+
+import pytest
+
+pytest.importorskip("peewee")
+
+from db.models.season2.cumulative_player_stats import CumulativePlayerStats  # noqa: E402
+
+
+def test_update_ranks_empty_runs_no_query(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("no query should be built for an empty ranking")
+
+    monkeypatch.setattr(CumulativePlayerStats, "rank_update_query", fail)
+
+    assert CumulativePlayerStats.update_ranks([]) == 0
+
+
+def test_rank_update_query_ranks_in_order():
+    sql, params = CumulativePlayerStats.rank_update_query([
+        (203999, date(2026, 1, 15)),
+        (1629029, date(2026, 1, 14)),
+    ]).sql()
+
+    assert sql.startswith('UPDATE "stats_s2"."cumulative_player_stats" SET "rank" = "ranks"."rank" FROM (VALUES ')
+    assert 'AS "ranks"("id", "date", "rank")' in sql
+    assert params == [203999, date(2026, 1, 15), 1, 1629029, date(2026, 1, 14), 2]
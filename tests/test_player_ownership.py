@@ -0,0 +1,99 @@
+"""
+PlayerOwnership.record_ownership_bulk.
+
+The SQL tests only render the query and run anywhere. The database tests run
+the upsert against real tables inside a transaction that is rolled back, and
+are skipped unless DATABASE_URL is set.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("peewee")
+
+from db.base import db  # noqa: E402
+from db.models.nba.player_ownership import PlayerOwnership  # noqa: E402
+from db.models.nba.players import Player  # noqa: E402
+
+
+def test_bulk_upsert_query_writes_every_not_null_column():
+    sql, params = PlayerOwnership.bulk_upsert_query(
+        {"nikola jokic": 99.9, "luka doncic": 99.5},
+        date(2026, 1, 15),
+    ).sql()
+
+    assert sql.startswith(
+        'INSERT INTO "nba"."player_ownership" '
+        '("player_id", "snapshot_date", "rost_pct", "pipeline_run_id", "created_at") SELECT '
+    )
+    assert 'AS "v"("name_normalized", "rost_pct")' in sql
+    assert 'ON CONFLICT ("player_id", "snapshot_date") DO UPDATE SET' in sql
+    assert '"created_at" = EXCLUDED' not in sql
+    # snapshot_date, pipeline_run_id, created_at, then the VALUES rows
+    assert params[0] == date(2026, 1, 15)
+    assert params[2] is not None
+    assert params[3:] == ["nikola jokic", 99.9, "luka doncic", 99.5]
+
+
+def test_record_ownership_bulk_empty_is_noop():
+    # Returns before building a query, so no database is needed
+    assert PlayerOwnership.record_ownership_bulk({}, date(2026, 1, 15)) == 0
+
+
+@pytest.fixture
+def ownership_tables(require_database):
+    """Create the nba tables in a transaction and roll it all back afterwards."""
+    with db.connection_context():
+        with db.atomic() as txn:
+            db.execute_sql('CREATE SCHEMA IF NOT EXISTS "nba"')
+            db.create_tables([Player, PlayerOwnership], safe=True)
+            Player.insert_many([
+                {"id": 203999, "name": "Nikola Jokić", "name_normalized": "nikola jokic"},
+                {"id": 1629029, "name": "Luka Dončić", "name_normalized": "luka doncic"},
+            ]).execute()
+            yield
+            txn.rollback()
+
+
+def _jokic_row(snapshot):
+    return PlayerOwnership.get(
+        (PlayerOwnership.player == 203999) & (PlayerOwnership.snapshot_date == snapshot)
+    )
+
+
+def test_record_ownership_bulk_inserts_matched_players(ownership_tables):
+    run_id = uuid4()
+    snapshot = date(2026, 1, 15)
+
+    inserted = PlayerOwnership.record_ownership_bulk(
+        {"nikola jokic": 99.9, "luka doncic": 99.5, "not a player": 12.0},
+        snapshot,
+        run_id,
+    )
+
+    assert inserted == 2
+    rows = {
+        row.player_id: row
+        for row in PlayerOwnership.select().where(PlayerOwnership.snapshot_date == snapshot)
+    }
+    assert set(rows) == {203999, 1629029}
+    assert float(rows[203999].rost_pct) == pytest.approx(99.9)
+    assert rows[203999].pipeline_run_id == run_id
+    assert all(row.created_at is not None for row in rows.values())
+
+
+def test_record_ownership_bulk_updates_existing_snapshot(ownership_tables):
+    snapshot = date(2026, 1, 15)
+    PlayerOwnership.record_ownership_bulk({"nikola jokic": 90.0}, snapshot)
+    created_at = _jokic_row(snapshot).created_at
+
+    second_run = uuid4()
+    updated = PlayerOwnership.record_ownership_bulk({"nikola jokic": 95.0}, snapshot, second_run)
+
+    assert updated == 1
+    row = _jokic_row(snapshot)
+    assert float(row.rost_pct) == pytest.approx(95.0)
+    assert row.pipeline_run_id == second_run
+    assert row.created_at == created_at
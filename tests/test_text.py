@@ -0,0 +1,21 @@
+"""utils.text combining-mark stripping; pure Python, no database needed."""
+
+from utils.text import strip_combining_marks
+
+
+def test_strips_latin_diacritics():
+    assert strip_combining_marks("Nikola Jokić") == "Nikola Jokic"
+    assert strip_combining_marks("Luka Dončić") == "Luka Doncic"
+
+
+def test_ascii_is_unchanged():
+    assert strip_combining_marks("LeBron James") == "LeBron James"
+
+
+def test_strips_marks_outside_the_diacritical_block():
+    # U+1DC0 (Combining Diacritical Marks Supplement), U+20D0 (... for Symbols)
+    assert strip_combining_marks("Jo\u1dc0kic\u20d0") == "Jokic"
+
+
+def test_keeps_non_mark_characters():
+    assert strip_combining_marks("Şengün ß") == "Sengun ß"
@@ -1,4 +1,4 @@
-import unicodedata
+from .text import strip_combining_marks
 
 # ------------------------------------------ ESPN Fantasy Data ------------------------------------------
 POSITION_MAP = {
@@ -198,4 +198,4 @@ def json_parsing(obj, key):
 
 def remove_diacritics(s: str) -> str:
     """Removes diacritics from a string"""
-    return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+    return strip_combining_marks(s)
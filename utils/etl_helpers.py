@@ -1,6 +1,24 @@
 from datetime import datetime
+import pandas as pd
+from pipelines.transformers.fantasy_points import calculate_fantasy_points_batch
 from .espn_helpers import remove_diacritics
 
+# Column order of a total_stats row
+TOTAL_ENTRY_COLUMNS = [
+    'id', 'name', 'team', 'date', 'fpts',
+    'pts', 'reb', 'ast', 'stl', 'blk',
+    'tov', 'fgm', 'fga', 'fg3m', 'fg3a',
+    'ftm', 'fta', 'min', 'gp', 'rost_pct'
+]
+
+# Column order of a total_stats row as read back from the database
+DB_ENTRY_COLUMNS = [
+    'id', 'name', 'team', 'date', 'fpts',
+    'pts', 'reb', 'ast', 'stl', 'blk',
+    'tov', 'fgm', 'fga', 'fg3m', 'fg3a',
+    'ftm', 'fta', 'min', 'gp', 'c_rank', 'p_rank'
+]
+
 def calculate_fantasy_points(stats):
     """Formula for the fantasy points of a player"""
     points_score = stats['pts']
@@ -59,12 +77,19 @@ def create_single_daily_entry(new):
                 new['rost_pct']
     )
 
-def create_daily_entries(had_game: list, old_dict: dict, date: datetime) -> list:
+def create_daily_entries(had_game: list, old_df: pd.DataFrame, date: datetime) -> list:
     """Creates the formatted entries for insertion into daily_stats"""
+    if not had_game:
+        return []
+
     entries = []
+    # Only the players who played need their old totals, so pull just those rows
+    played_ids = old_df.index.intersection([d['id'] for d in had_game])
+    old_dict = old_df.loc[played_ids].to_dict('index')
 
-    for d in had_game:
-        d['fpts'] = calculate_fantasy_points(d)
+    fpts_column = calculate_fantasy_points_batch(pd.DataFrame(had_game))
+    for d, fpts in zip(had_game, fpts_column):
+        d['fpts'] = int(fpts)
         d['date'] = date
         if d['id'] in old_dict:
             entries.append(create_daily_entry(old_dict[d['id']], d))
@@ -73,78 +98,56 @@ def create_daily_entries(had_game: list, old_dict: dict, date: datetime) -> list
         
     return entries
 
-def create_total_entries(updated_dict: dict, old_dict: dict, id_map: set, today: datetime) -> list:
+def create_total_entries(updated_dict: dict, old_df: pd.DataFrame, id_map: set, today: datetime) -> list:
     """Creates the formatted entries for insertion into total_stats"""
-    return [
-        (
-            id,
-            d['name'],
-            d['team'],
-            today if id in id_map else old_dict[id]['date'],
-            calculate_fantasy_points(d),
-            d['pts'], d['reb'], d['ast'], d['stl'], d['blk'],
-            d['tov'], d['fgm'], d['fga'], d['fg3m'], d['fg3a'],
-            d['ftm'], d['fta'], d['min'], d['gp'], d['rost_pct']
-        )
-        for id, d in updated_dict.items()
-    ]
-
-def restructure_data(data: list) -> dict:
-    """Takes in the raw data from the database and returns a restructured dict that looks the same as the NBA API data"""
-    old_dict = {}
-    for player in data:
-        old_dict[player[0]] = {
-            'id': player[0],
-            'name': player[1],
-            'team': player[2],
-            'date': player[3],
-            'fpts': player[4],
-            'pts': player[5],
-            'reb': player[6],
-            'ast': player[7],
-            'stl': player[8],
-            'blk': player[9],
-            'tov': player[10],
-            'fgm': player[11],
-            'fga': player[12],
-            'fg3m': player[13],
-            'fg3a': player[14],
-            'ftm': player[15],
-            'fta': player[16],
-            'min': player[17],
-            'gp': player[18],
-            'c_rank': player[19],
-            'p_rank': player[20]
-        }
-
-    return old_dict
-
-def get_players_to_update(api_data: dict, db_data: dict) -> tuple:
+    if not updated_dict:
+        return []
+
+    df = pd.DataFrame.from_records(list(updated_dict.values()))
+    df['id'] = list(updated_dict)
+    df['fpts'] = calculate_fantasy_points_batch(df)
+
+    # Players who played today get today's date, everyone else keeps their old one
+    df['date'] = df['id'].map(old_df['date']).mask(df['id'].isin(list(id_map)), today)
+
+    # astype(object) hands back native Python scalars for the DB driver
+    return list(df[TOTAL_ENTRY_COLUMNS].astype(object).itertuples(index=False, name=None))
+
+def restructure_data(data: list) -> pd.DataFrame:
+    """Takes in the raw data from the database and returns it as a frame indexed by player id"""
+    df = pd.DataFrame(data, columns=DB_ENTRY_COLUMNS)
+    # Keep 'id' as a column too, but leave the index unnamed so merges on 'id' aren't ambiguous
+    df.index = df['id'].to_numpy()
+    return df
+
+def get_players_to_update(api_data: dict, db_data: pd.DataFrame) -> tuple:
     """Compare the data from the NBA API and the database to find the players who played"""
-    had_game = []
-    id_map = set()
-    for id, d in api_data.items():
-        # If the player is not in the db data, we know they played
-        if id not in db_data:
-            had_game.append(d)
-            id_map.add(id)
-            continue
-        # If the player is in the old data, but 'gp' is different, we know they played
-        if d['gp'] != db_data[id]['gp']:
-            had_game.append(d)
-            id_map.add(id)
-    
-    return had_game, id_map
+    if not api_data:
+        return [], set()
+
+    api_df = pd.DataFrame({'id': list(api_data), 'gp': [d['gp'] for d in api_data.values()]})
+    merged = api_df.merge(db_data[['id', 'gp']], on='id', how='left', suffixes=('', '_db'))
+    # A player played if they're new to the db data or their 'gp' has changed
+    had_game_mask = merged['gp_db'].isna() | (merged['gp'] != merged['gp_db'])
+
+    played_ids = merged.loc[had_game_mask, 'id'].tolist()
+    return [api_data[id] for id in played_ids], set(played_ids)
+
+# Field order of an FPTS leaderboard row
+FPTS_PLAYER_FIELDS = ('rank', 'player_id', 'player_name', 'total_fpts', 'avg_fpts', 'rank_change')
+
+# TypeAdapter(list[FPTSPlayer]), built on first use by serialize_fpts_data
+_fpts_players_adapter = None
 
 def serialize_fpts_data(data: list) -> list:
     """Serialize FPTS data for response"""
-    from app.schemas.etl import FPTSPlayer
-    
-    return [FPTSPlayer(
-        rank=player[0],
-        player_id=player[1],
-        player_name=player[2],
-        total_fpts=player[3],
-        avg_fpts=player[4],
-        rank_change=player[5]
-    ) for player in data]
+    global _fpts_players_adapter
+    if _fpts_players_adapter is None:
+        # Deferred so importing this module doesn't require the app schemas
+        from pydantic import TypeAdapter
+        from app.schemas.etl import FPTSPlayer
+        _fpts_players_adapter = TypeAdapter(list[FPTSPlayer])
+
+    return _fpts_players_adapter.validate_python(
+        [dict(zip(FPTS_PLAYER_FIELDS, player)) for player in data]
+    )
@@ -8,6 +8,8 @@ This module must be imported early in application startup (e.g., in main.py)
 to ensure the patch is applied before any nba_api calls are made.
 """
 
+import threading
+
 from curl_cffi import requests
 from nba_api.library.http import NBAHTTP
 
@@ -25,6 +27,19 @@ NBA_BROWSER_HEADERS = {
     'x-nba-stats-token': 'true',
 }
 
+# One impersonating session per thread, so connections and TLS sessions are
+# reused across calls (curl_cffi sessions aren't safe to share across threads)
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Get this thread's browser-impersonating curl_cffi session."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session(impersonate="chrome110")
+        _thread_local.session = session
+    return session
+
 
 def browser_impersonation_request(
     self,
@@ -56,13 +71,12 @@ def browser_impersonation_request(
     # but curl_cffi sends them as the string "None". Filter them out.
     clean_params = {k: v for k, v in parameters.items() if v is not None}
 
-    # Send request with browser impersonation
-    response = requests.get(
+    # Send request with browser impersonation over the reused session
+    response = _get_session().get(
         base_url,
         params=clean_params,
         headers=request_headers,
         timeout=timeout or 30,
-        impersonate="chrome110"
     )
 
     status_code = response.status_code
@@ -0,0 +1,25 @@
+import unicodedata
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that deletes every nonspacing mark (category Mn).
+
+    Code points are classified on first sight and memoised, so after warm-up a
+    translate pass is a plain C-level dict lookup per character.
+    """
+
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+# Shared by every name normaliser; covers all Mn marks, not just U+0300-U+036F
+COMBINING_MARKS = _CombiningMarkTable()
+
+
+def strip_combining_marks(s: str) -> str:
+    """Decomposes a string (NFD) and drops its combining marks, e.g. 'Jokić' -> 'Jokic'"""
+    if s.isascii():
+        return s
+    return unicodedata.normalize('NFD', s).translate(COMBINING_MARKS)